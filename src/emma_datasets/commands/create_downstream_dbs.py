@@ -1,4 +1,7 @@
+import os
+from functools import partial
 from itertools import groupby
+from multiprocessing.pool import Pool
 from pathlib import Path
 from typing import Optional, Union
 
@@ -35,7 +38,7 @@ from emma_datasets.datamodels.datasets.utils.simbot_utils.simbot_datamodels impo
 )
 from emma_datasets.datamodels.datasets.vqa_v2 import (
     get_vqa_v2_annotation_paths,
-    load_vqa_v2_annotations,
+    load_vqa_v2_annotations_per_split,
     load_vqa_visual_genome_annotations,
     resplit_vqa_v2_annotations,
 )
@@ -223,11 +226,10 @@ def create_vqa_v2_instances(
     """Create DB files for VQA-v2."""
     vqa_v2_dir_paths = get_vqa_v2_annotation_paths(vqa_v2_instances_base_dir)
 
-    source_per_split = {}
-    for split_paths in vqa_v2_dir_paths:
-        source_per_split[split_paths.split] = load_vqa_v2_annotations(
-            questions_path=split_paths.questions_path, answers_path=split_paths.answers_path
-        )
+    # There is only one task per split, so any extra processes would sit idle
+    num_split_workers = min(num_workers or os.cpu_count() or 1, len(vqa_v2_dir_paths))
+    with Pool(num_split_workers) as pool:
+        source_per_split = load_vqa_v2_annotations_per_split(vqa_v2_dir_paths, pool=pool)
     if resplit_trainval:
         train_annotations, valid_annotations = resplit_vqa_v2_annotations(
             vqa_v2_instances_base_dir,
@@ -392,13 +394,23 @@ def create_simbot_instruction_instances(
     train_num_additional_synthetic_instructions: int = 20000,
     valid_num_additional_synthetic_instructions: int = -1,
 ) -> None:
-    """Create DB files for Alexa Prize SimBot mission data."""
-    source_per_split = load_simbot_annotations(
+    """Create DB files for Alexa Prize SimBot mission data.
+
+    The missions are only processed in parallel when `num_workers` is given, since every worker
+    loads its own spaCy model.
+    """
+    load_annotations = partial(
+        load_simbot_annotations,
         simbot_instances_base_dir,
         annotation_type="instructions",
         train_num_additional_synthetic_instructions=train_num_additional_synthetic_instructions,
         valid_num_additional_synthetic_instructions=valid_num_additional_synthetic_instructions,
     )
+    if num_workers is None:
+        source_per_split = load_annotations()
+    else:
+        with Pool(num_workers) as pool:
+            source_per_split = load_annotations(pool=pool)
 
     DownstreamDbCreator.from_one_instance_per_dict(
         dataset_name=DatasetName.simbot_instructions,
@@ -1,6 +1,7 @@
 from emma_datasets.common.downloader import Downloader
 from emma_datasets.common.logger import get_logger, use_rich_for_logging
 from emma_datasets.common.progress import (
+    BatchedProgress,
     BatchesProcessedColumn,
     CustomTimeColumn,
     ProcessingSpeedColumn,
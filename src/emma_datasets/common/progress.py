@@ -1,7 +1,9 @@
+import time
 from datetime import timedelta
+from typing import Any
 
 from rich.console import RenderableType
-from rich.progress import BarColumn, Progress, ProgressColumn, Task, TextColumn
+from rich.progress import BarColumn, Progress, ProgressColumn, Task, TaskID, TextColumn
 from rich.text import Text
 
 
@@ -50,3 +52,49 @@ def get_progress() -> Progress:
         ProcessingSpeedColumn(),
         TextColumn("[purple]{task.fields[comment]}[/]"),
     )
+
+
+class BatchedProgress:
+    """Advance a progress task in batches instead of on every item.
+
+    Every call to `Progress.update()` takes a lock, so advancing once per item is slow when there
+    are millions of them. Pending advances are passed on once there are `batch_size` of them, or
+    once `flush_interval` seconds have passed since the last update.
+
+    Any fields given to `advance()` (e.g., the comment) are kept until the batch is passed on,
+    with later values replacing earlier ones. Call `flush()` when finished to pass on any
+    remaining advances and fields.
+    """
+
+    def __init__(
+        self,
+        progress: Progress,
+        task_id: TaskID,
+        batch_size: int = 512,
+        flush_interval: float = 0.05,
+    ) -> None:
+        self.progress = progress
+        self.task_id = task_id
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+
+        self._pending = 0
+        self._pending_fields: dict[str, Any] = {}
+        self._last_flush = time.monotonic()
+
+    def advance(self, **fields: Any) -> None:
+        """Advance the task by one, updating the progress if the batch is ready."""
+        self._pending += 1
+        self._pending_fields.update(fields)
+
+        is_batch_full = self._pending >= self.batch_size
+        if is_batch_full or time.monotonic() - self._last_flush > self.flush_interval:
+            self.flush()
+
+    def flush(self, **fields: Any) -> None:
+        """Pass any pending advances and fields on to the progress."""
+        self._pending_fields.update(fields)
+        self.progress.update(self.task_id, advance=self._pending, **self._pending_fields)
+        self._pending = 0
+        self._pending_fields = {}
+        self._last_flush = time.monotonic()
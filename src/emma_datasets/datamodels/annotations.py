@@ -1,4 +1,5 @@
 import re
+from functools import lru_cache
 from typing import Optional, Union
 
 import numpy
@@ -14,6 +15,22 @@ from emma_datasets.datamodels.generics import GenericActionTrajectory
 
 BBox = NDArray[numpy.float32]
 
+CAMEL_CASE_PATTERN = re.compile("[A-Z][^A-Z]*")
+
+
+@lru_cache(maxsize=None)
+def get_action_string(action_name: str) -> str:
+    """Returns a phrase associated with the action API name.
+
+    API action names are in camelcase format: MoveAhead_25
+    """
+    parts: list[str] = []
+
+    for x in CAMEL_CASE_PATTERN.findall(action_name):
+        parts.extend(xi for xi in x.split("_"))
+
+    return " ".join(parts)
+
 
 class Annotation(BaseModel):
     """Base annotation used by other annotation interfaces."""
@@ -69,17 +86,21 @@ class SceneGraph(Annotation):
 
     def get_language_data(self) -> list[str]:
         """Get the language data from a Scene Graph."""
-        annotations = []
+        annotations: list[str] = []
+        scene_objects = self.objects
 
-        for scene_obj in self.objects.values():
+        for scene_obj in scene_objects.values():
+            obj_name = scene_obj.name
             if scene_obj.attributes:
-                for attr in scene_obj.attributes:
-                    annotations.append(f"{scene_obj.name} has attribute {attr}")
+                annotations.extend(
+                    f"{obj_name} has attribute {attr}" for attr in scene_obj.attributes
+                )
 
             if scene_obj.relations:
-                for rel in scene_obj.relations:
-                    rel_object = self.objects[rel.object]
-                    annotations.append(f"{scene_obj.name} {rel.name} {rel_object.name}")
+                annotations.extend(
+                    f"{obj_name} {rel.name} {scene_objects[rel.object].name}"
+                    for rel in scene_obj.relations
+                )
 
         return annotations
 
@@ -152,24 +173,12 @@ class ActionTrajectory(GenericActionTrajectory[AlfredLowAction, AlfredHighAction
     def get_language_data(self) -> str:
         """Get the language data from an action trajectory."""
         trajectory_str = " ".join(
-            self._get_action_string(low_action.discrete_action.action)
+            get_action_string(low_action.discrete_action.action)
             for low_action in self.low_level_actions
         )
 
         return trajectory_str
 
-    def _get_action_string(self, action_name: str) -> str:
-        """Returns a phrase associated with the action API name.
-
-        API action names are in camelcase format: MoveAhead_25
-        """
-        parts: list[str] = []
-
-        for x in re.findall("[A-Z][^A-Z]*", action_name):
-            parts.extend(xi for xi in x.split("_"))
-
-        return " ".join(parts)
-
 
 class TaskDescription(Annotation):
     """Text caption for the image."""
@@ -1,6 +1,8 @@
 import json
 import logging
 import random
+from functools import lru_cache, partial
+from multiprocessing.pool import Pool
 from pathlib import Path
 from typing import Any, Literal, Optional
 
@@ -36,6 +38,11 @@ logging.basicConfig()
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
+SimBotDicts = list[dict[str, Any]]
+
+# The mission id, human annotations, actions and CDF high-level key of a mission
+SimBotMissionData = tuple[str, SimBotDicts, SimBotDicts, Optional[str]]
+
 
 def load_simbot_mission_data(filepath: Path) -> list[dict[Any, Any]]:
     """Loads and reformats the SimBot annotations for creating SimBot missions."""
@@ -56,22 +63,52 @@ def load_simbot_mission_data(filepath: Path) -> list[dict[Any, Any]]:
     return restructured_data
 
 
+@lru_cache(maxsize=None)
+def _get_trajectory_instruction_processor(
+    skip_goto_rooms: bool, cdf_augmentation: bool
+) -> TrajectoryInstructionProcessor:
+    """Get the processor for the human annotations, created once in every process."""
+    return TrajectoryInstructionProcessor(
+        skip_goto_rooms=skip_goto_rooms, cdf_augmentation=cdf_augmentation
+    )
+
+
+def process_mission_human_annotations(
+    mission: SimBotMissionData,
+    skip_goto_rooms: bool = True,
+    cdf_augmentation: bool = False,
+) -> list[dict[Any, Any]]:
+    """Create the instruction dicts from the human annotations of a single mission.
+
+    The mission is given as a tuple of the mission id, the human annotations, the actions and the
+    CDF high-level key, so that missions can be processed independently by a pool of workers.
+    """
+    mission_id, human_annotations, actions, cdf_highlevel_key = mission
+    processor = _get_trajectory_instruction_processor(skip_goto_rooms, cdf_augmentation)
+    return processor.run(
+        human_annotations=human_annotations,
+        mission_id=mission_id,
+        actions=actions,
+        instruction_idx=0,
+        cdf_highlevel_key=cdf_highlevel_key,
+    )
+
+
 def load_simbot_trajectory_instruction_data(
     trajectory_json_path: Path,
     skip_goto_rooms: bool = True,
     use_synthetic_action_sampler: bool = False,
     num_additional_synthetic_instructions: int = -1,
+    pool: Optional[Pool] = None,
 ) -> list[dict[Any, Any]]:
-    """Loads the SimBot annotations for creating SimBot trajectories."""
+    """Loads the SimBot annotations for creating SimBot trajectories.
+
+    If a pool is provided, the human annotations of each mission are processed in parallel.
+    """
     trajectory_instruction_data = []
     with open(trajectory_json_path) as fp:
         data = json.load(fp)
 
-    human_instruction_processor = TrajectoryInstructionProcessor(
-        skip_goto_rooms=skip_goto_rooms,
-        cdf_augmentation=False,
-    )
-
     synthetic_instruction_processor = SyntheticIntructionsPreprocessor(
         skip_goto_rooms=skip_goto_rooms,
         use_synthetic_action_sampler=use_synthetic_action_sampler,
@@ -79,43 +116,57 @@ def load_simbot_trajectory_instruction_data(
     )
 
     inventory_object_processor = InventoryObjectfromTrajectory()
-    for mission_id, mission_annotations in data.items():
-        actions = inventory_object_processor(mission_annotations["actions"])
-
-        instruction_idx = 0
-        # Human annotations
-        instruction_dicts = human_instruction_processor.run(
-            human_annotations=mission_annotations["human_annotations"],
-            mission_id=mission_id,
-            actions=actions,
-            instruction_idx=instruction_idx,
+    missions: list[SimBotMissionData] = [
+        (
+            mission_id,
+            mission_annotations["human_annotations"],
+            inventory_object_processor(mission_annotations["actions"]),
+            None,
         )
-        trajectory_instruction_data.extend(instruction_dicts)
-        instruction_idx += len(instruction_dicts)
+        for mission_id, mission_annotations in data.items()
+    ]
+
+    # Human annotations
+    process_mission = partial(
+        process_mission_human_annotations,
+        skip_goto_rooms=skip_goto_rooms,
+        cdf_augmentation=False,
+    )
+    human_instruction_dicts = (
+        pool.imap(process_mission, missions)
+        if pool is not None
+        else map(process_mission, missions)
+    )
+
+    for mission, mission_instruction_dicts in zip(missions, human_instruction_dicts):
+        mission_id, _, actions, _ = mission
+        trajectory_instruction_data.extend(mission_instruction_dicts)
 
         # Synthetic annotations
-        instruction_dicts = synthetic_instruction_processor.run(
-            synthetic_annotations=mission_annotations["synthetic_annotations"],
+        synthetic_instruction_dicts = synthetic_instruction_processor.run(
+            synthetic_annotations=data[mission_id]["synthetic_annotations"],
             mission_id=mission_id,
             actions=actions,
-            instruction_idx=instruction_idx,
+            instruction_idx=len(mission_instruction_dicts),
         )
-        trajectory_instruction_data.extend(instruction_dicts)
+        trajectory_instruction_data.extend(synthetic_instruction_dicts)
     return trajectory_instruction_data
 
 
-def load_synthetic_trajectory_instruction_data(trajectory_json_path: Path) -> list[dict[Any, Any]]:
-    """Loads the annotations for creating synthetic (CDF) trajectories."""
+def load_synthetic_trajectory_instruction_data(
+    trajectory_json_path: Path, pool: Optional[Pool] = None
+) -> list[dict[Any, Any]]:
+    """Loads the annotations for creating synthetic (CDF) trajectories.
+
+    If a pool is provided, the missions are processed in parallel.
+    """
     trajectory_instruction_data = []
     with open(trajectory_json_path) as fp:
         data = json.load(fp)
 
-    trajectory_instruction_processor = TrajectoryInstructionProcessor(
-        skip_goto_rooms=False,
-        cdf_augmentation=True,
-    )
     inventory_object_processor = InventoryObjectfromTrajectory()
 
+    missions: list[SimBotMissionData] = []
     for mission_id, mission_annotations in data.items():
         # T.20230412__action--pickup_target-object--Apple_from-receptacle--FridgeUpper_02_from-receptacle-is-container-citxf_add_gotoFalse
         cdf_highlevel_key = mission_id.split("__")[1].split("_add")[0]
@@ -125,17 +176,22 @@ def load_synthetic_trajectory_instruction_data(trajectory_json_path: Path) -> li
             initial_inventory = decoded_key.target_object
 
         actions = inventory_object_processor(mission_annotations["actions"], initial_inventory)
-
-        instruction_idx = 0
-        instruction_dicts = trajectory_instruction_processor.run(
-            human_annotations=mission_annotations["human_annotations"],
-            mission_id=mission_id,
-            actions=actions,
-            instruction_idx=instruction_idx,
-            cdf_highlevel_key=cdf_highlevel_key,
+        missions.append(
+            (mission_id, mission_annotations["human_annotations"], actions, cdf_highlevel_key)
         )
+
+    process_mission = partial(
+        process_mission_human_annotations,
+        skip_goto_rooms=False,
+        cdf_augmentation=True,
+    )
+    instruction_dicts_per_mission = (
+        pool.imap(process_mission, missions)
+        if pool is not None
+        else map(process_mission, missions)
+    )
+    for instruction_dicts in instruction_dicts_per_mission:
         trajectory_instruction_data.extend(instruction_dicts)
-        instruction_idx += len(instruction_dicts)
     return trajectory_instruction_data
 
 
@@ -147,6 +203,7 @@ def load_simbot_data(
     num_additional_synthetic_instructions: int = -1,
     skip_goto_rooms: bool = True,
     use_synthetic_action_sampler: bool = False,
+    pool: Optional[Pool] = None,
 ) -> list[dict[Any, Any]]:
     """Loads and reformats the SimBot annotations for creating Simbot instructions."""
     instruction_data = []
@@ -160,6 +217,7 @@ def load_simbot_data(
                 skip_goto_rooms=skip_goto_rooms,
                 use_synthetic_action_sampler=use_synthetic_action_sampler,
                 num_additional_synthetic_instructions=num_additional_synthetic_instructions,
+                pool=pool,
             )
         )
 
@@ -169,6 +227,7 @@ def load_simbot_data(
         instruction_data.extend(
             load_synthetic_trajectory_instruction_data(
                 trajectory_json_path=synthetic_trajectory_json_path,
+                pool=pool,
             )
         )
 
@@ -230,6 +289,7 @@ def load_simbot_annotations(
     annotation_type: Literal["missions", "instructions"] = "missions",
     train_num_additional_synthetic_instructions: int = 20000,
     valid_num_additional_synthetic_instructions: int = -1,
+    pool: Optional[Pool] = None,
 ) -> dict[DatasetSplit, Any]:
     """Loads all the SimBot mission annotation files."""
     if annotation_type == "missions":
@@ -249,6 +309,7 @@ def load_simbot_annotations(
                     "train_augmentation_images_new_classes_v6.2.json"
                 ),
                 num_additional_synthetic_instructions=train_num_additional_synthetic_instructions,
+                pool=pool,
             ),
             DatasetSplit.valid: load_simbot_data(
                 simbot_trajectory_json_path=base_dir.joinpath("valid.json"),
@@ -260,8 +321,11 @@ def load_simbot_annotations(
                     "valid_augmentation_images_new_classes_v6.2.json"
                 ),
                 num_additional_synthetic_instructions=valid_num_additional_synthetic_instructions,
+                pool=pool,
             ),
         }
+        # Release the spaCy model if the missions were processed in this process
+        _get_trajectory_instruction_processor.cache_clear()
 
     return source_per_split
 
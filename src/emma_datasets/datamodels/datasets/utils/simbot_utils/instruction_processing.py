@@ -1,7 +1,9 @@
 import re
+import sys
 from typing import Any, Optional
 
 import spacy
+from spacy.tokens import Doc
 
 from emma_datasets.constants.simbot.simbot import get_arena_definitions
 from emma_datasets.datamodels.datasets.utils.simbot_utils.simbot_datamodels import (
@@ -82,10 +84,13 @@ class ClarificationTargetExtractor:
     Spelling correction did not work for some cases, for which we fix it manually.
     """
 
-    def __init__(self, spacy_model: str = "en_core_web_sm") -> None:
+    def __init__(self, spacy_model: str = "en_core_web_sm", batch_size: int = 512) -> None:
         self.nlp = spacy.load(spacy_model)
+        self._batch_size = batch_size
 
         self.nlp.add_pipe("merge_noun_chunks")
+        # The same questions are asked across missions, so their targets are extracted only once
+        self._question_targets: dict[tuple[str, SimBotClarificationTypes], Optional[str]] = {}
         self._prefer_naive = {"look"}  # The verb 'look' is sometimes confused as a noun
         self._skipped_nouns = {"can", "sink", "floppy"}  # Cannot identify certain words as nouns
         # Rule-based approach to get the target word from its position.
@@ -187,14 +192,29 @@ class ClarificationTargetExtractor:
         question_type: SimBotClarificationTypes,
     ) -> Optional[str]:
         """Preprocess the clarification target."""
-        tokens = question.split()
-        target_index = min(self.target_index[question_type], len(tokens) - 1)
-        naive_target = self.get_naive_target(tokens, target_index=target_index)
-        target = self.get_target(question, target_index=target_index)
-        if target is None or naive_target in self._prefer_naive:
-            target = naive_target
+        return self.batch([question], [question_type])[0]
 
-        return target
+    def batch(
+        self,
+        questions: list[str],
+        question_types: list[SimBotClarificationTypes],
+    ) -> list[Optional[str]]:
+        """Preprocess the clarification targets for multiple questions with a single spacy pass.
+
+        Only questions that have not been seen before are parsed.
+        """
+        question_keys = list(zip(questions, question_types))
+        new_question_keys = list(
+            dict.fromkeys(key for key in question_keys if key not in self._question_targets)
+        )
+        docs = self.nlp.pipe(
+            (question.lower() for question, _ in new_question_keys), batch_size=self._batch_size
+        )
+        for (question, question_type), doc in zip(new_question_keys, docs):
+            self._question_targets[(question, question_type)] = self._get_question_target(
+                question, question_type, doc
+            )
+        return [self._question_targets[key] for key in question_keys]
 
     def normalize_target(self, target: Optional[str], instruction: str) -> Optional[str]:
         """Convert the target to an object detection label."""
@@ -214,9 +234,24 @@ class ClarificationTargetExtractor:
         naive_target = question_tokens[target_index]
         return re.sub(r"[^\w\s]", "", naive_target)
 
-    def get_target(self, question: str, target_index: int) -> Optional[str]:  # noqa: WPS231
+    def get_target(self, question: str, target_index: int) -> Optional[str]:
         """Apply spell correction and find a noun phrase."""
-        doc = self.nlp(question.lower())
+        return self._get_target_from_doc(self.nlp(question.lower()), target_index=target_index)
+
+    def _get_question_target(
+        self, question: str, question_type: SimBotClarificationTypes, doc: Doc
+    ) -> Optional[str]:
+        """Get the clarification target for a question that has already been parsed."""
+        tokens = question.split()
+        target_index = min(self.target_index[question_type], len(tokens) - 1)
+        naive_target = self.get_naive_target(tokens, target_index=target_index)
+        target = self._get_target_from_doc(doc, target_index=target_index)
+        if target is None or naive_target in self._prefer_naive:
+            target = naive_target
+
+        return target
+
+    def _get_target_from_doc(self, doc: Doc, target_index: int) -> Optional[str]:  # noqa: WPS231
         target = None
         for index, token in enumerate(doc):
             if index > target_index and token.is_stop:
@@ -249,19 +284,33 @@ class InventoryObjectfromTrajectory:
     def __call__(
         self, actions: list[dict[str, Any]], initial_inventory: Optional[str] = None
     ) -> list[dict[str, Any]]:
-        """Add the inventory object to actions."""
+        """Add the inventory object to actions.
+
+        The action types and object ids are also interned, since they are repeated across all the
+        actions of every mission.
+        """
         inventory_object = initial_inventory
         for action in actions:
+            action_type = sys.intern(action["type"])
+            action["type"] = action_type
+            self._intern_object_id(action.get(action_type.lower()))
             action["inventory_object_id"] = inventory_object
             # Update the object that will be held after the current action
-            if action["type"] == "Pickup":
+            if action_type == "Pickup":
                 inventory_object = action["pickup"]["object"]["id"]
-            elif action["type"] == "Place":
+            elif action_type == "Place":
                 inventory_object = None
-            elif self._action_deletes_inventory(action["type"], inventory_object):
+            elif self._action_deletes_inventory(action_type, inventory_object):
                 inventory_object = None
         return actions
 
+    def _intern_object_id(self, action_metadata: Optional[Any]) -> None:
+        if not isinstance(action_metadata, dict):
+            return
+        action_object = action_metadata.get("object")
+        if isinstance(action_object, dict) and isinstance(action_object.get("id"), str):
+            action_object["id"] = sys.intern(action_object["id"])
+
     def _action_deletes_inventory(self, action_type: str, inventory_object: Optional[str]) -> bool:
         pour_coffee_beans = (
             action_type == "Pour"
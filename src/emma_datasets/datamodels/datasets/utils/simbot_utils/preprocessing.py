@@ -1,4 +1,7 @@
-from copy import deepcopy
+import re
+from functools import cached_property
+from itertools import islice
+from types import MappingProxyType
 from typing import Any, Optional
 
 from emma_datasets.datamodels.datasets.utils.simbot_utils.ambiguous_data import (
@@ -15,47 +18,62 @@ from emma_datasets.datamodels.datasets.utils.simbot_utils.simbot_datamodels impo
 )
 
 
+QUESTION_TYPES = MappingProxyType({qtype.value: qtype for qtype in SimBotClarificationTypes})
+UNTARGETED_QUESTION_TYPES = frozenset(
+    (SimBotClarificationTypes.other, SimBotClarificationTypes.direction)
+)
+SPATIAL_KEYWORDS_PATTERN = re.compile("left|right|behind|front")
+
+
 def get_question_type(question: str) -> SimBotClarificationTypes:
     """Get the type for a given question."""
     question = question.lower()
-    question_types = {qtype.value: qtype for qtype in SimBotClarificationTypes}
+    # Only the first two words are needed to determine the question type
+    question_tokens = question.split(maxsplit=2)
     if question.startswith("which"):
-        if question.split()[1] == "direction":
+        if len(question_tokens) > 1 and question_tokens[1] == "direction":
             qtype = "which direction"
         else:
             qtype = "which+instruction_noun"
     else:
-        qtype = " ".join(question.split()[:2])
-    return question_types.get(qtype, SimBotClarificationTypes.other)
-
-
-def get_question_target(
-    clarification_target_extractor: ClarificationTargetExtractor,
-    question: str,
-    question_type: SimBotClarificationTypes,
-) -> Optional[str]:
-    """Get the type for a given question."""
-    if question_type == SimBotClarificationTypes.other:
-        return None
-    if question_type == SimBotClarificationTypes.direction:
-        return None
-    return clarification_target_extractor(question, question_type)
+        qtype = " ".join(question_tokens[:2])
+    return QUESTION_TYPES.get(qtype, SimBotClarificationTypes.other)
 
 
 def prepare_instruction_question_answers(
     clarification_target_extractor: ClarificationTargetExtractor, instruction: dict[str, Any]
 ) -> dict[str, Any]:
     """Add question types and targets."""
-    if "question_answers" not in instruction:
-        return instruction
-    for question_answer in instruction["question_answers"]:
-        question_answer["question_type"] = get_question_type(question=question_answer["question"])
-        question_answer["question_target"] = get_question_target(
-            clarification_target_extractor,
-            question=question_answer["question"],
-            question_type=question_answer["question_type"],
-        )
-    return instruction
+    return prepare_instructions_question_answers(clarification_target_extractor, [instruction])[0]
+
+
+def prepare_instructions_question_answers(
+    clarification_target_extractor: ClarificationTargetExtractor,
+    instructions: list[dict[str, Any]],
+) -> list[dict[str, Any]]:
+    """Add question types and targets to multiple instructions.
+
+    The targets of all the questions are extracted together in a single batch.
+    """
+    targeted_question_answers = []
+    for instruction in instructions:
+        for question_answer in instruction.get("question_answers", []):
+            question_type = get_question_type(question_answer["question"])
+            question_answer["question_type"] = question_type
+            question_answer["question_target"] = None
+            if question_type not in UNTARGETED_QUESTION_TYPES:
+                targeted_question_answers.append(question_answer)
+
+    if not targeted_question_answers:
+        return instructions
+
+    question_targets = clarification_target_extractor.batch(
+        questions=[qa_pair["question"] for qa_pair in targeted_question_answers],
+        question_types=[qa_pair["question_type"] for qa_pair in targeted_question_answers],
+    )
+    for targeted_qa_pair, question_target in zip(targeted_question_answers, question_targets):
+        targeted_qa_pair["question_target"] = question_target
+    return instructions
 
 
 def create_instruction_dict(
@@ -73,10 +91,15 @@ def create_instruction_dict(
     cdf_highlevel_key: Optional[str] = None,
     **kwargs: Any,
 ) -> dict[str, Any]:
-    """Create an instruction dict."""
+    """Create an instruction dict.
+
+    Additional keyword arguments are ignored, so that augmentation metadata with extra fields (e.g.
+    `room_name`, `positive`) can be unpacked directly into this function.
+    """
     action_start_id = instruction["actions"][0]
     action_end_id = instruction["actions"][-1]
-    instruction_actions = deepcopy(actions[action_start_id : action_end_id + 1])
+    # Only the top-level `final` key is modified, so shallow copies of the actions are enough
+    instruction_actions = [dict(action) for action in actions[action_start_id : action_end_id + 1]]
 
     # add the final label for the last action within an instruction
     instruction_actions[-1]["final"] = True
@@ -107,17 +130,10 @@ def instruction_has_spatial_info(instruction_dict: dict[str, Any]) -> bool:
     filter out look around actions from human instructions.
     """
     question_answers = instruction_dict.get("question_answers", [])
-    qa_concatenations = [f"{qa['question']} {qa['answer']}" for qa in question_answers]
+    qa_concatenations = " ".join(f"{qa['question']} {qa['answer']}" for qa in question_answers)
 
-    concat_string = " ".join([instruction_dict["instruction"]] + qa_concatenations)
-
-    has_spatial_info = (
-        "left" in concat_string
-        or "right" in concat_string
-        or "behind" in concat_string
-        or "front" in concat_string
-    )
-    return has_spatial_info
+    concat_string = f"{instruction_dict['instruction']} {qa_concatenations}"
+    return SPATIAL_KEYWORDS_PATTERN.search(concat_string) is not None
 
 
 def get_action_types_for_instruction(
@@ -129,32 +145,38 @@ def get_action_types_for_instruction(
     return [action["type"] for action in actions[action_start_id : action_end_id + 1]]
 
 
+def action_types_are_goto_room(
+    action_types: list[str], instruction_dict: dict[str, Any], actions: list[dict[str, Any]]
+) -> bool:
+    """Determine whether the already computed action types form a goto room instruction."""
+    if len(action_types) != 1 or action_types[0].lower() != "goto":
+        return False
+    return "officeRoom" in actions[instruction_dict["actions"][0]]["goto"]["object"]
+
+
+def action_types_are_look(action_types: list[str]) -> bool:
+    """Determine whether the already computed action types form a look instruction."""
+    return len(action_types) == 1 and action_types[0].lower() == "look"
+
+
 def instruction_is_goto_room(
     instruction_dict: dict[str, Any], actions: list[dict[str, Any]]
 ) -> bool:
     """Determine whether the instruction is a goto room instruction."""
     action_types = get_action_types_for_instruction(instruction_dict, actions)
-    instruction_actions = instruction_dict["actions"]
-    return all(
-        [
-            len(action_types) == 1,
-            action_types[0].lower() == "goto"
-            and "officeRoom" in actions[instruction_actions[0]]["goto"]["object"].keys(),
-        ]
-    )
+    return action_types_are_goto_room(action_types, instruction_dict, actions)
 
 
 def instruction_is_look(instruction_dict: dict[str, Any], actions: list[dict[str, Any]]) -> bool:
     """Determine whether the instruction is a look instruction."""
     action_types = get_action_types_for_instruction(instruction_dict, actions)
-    return all([len(action_types) == 1, action_types[0].lower() == "look"])
+    return action_types_are_look(action_types)
 
 
 class TrajectoryInstructionProcessor:
     """Preprocess the instruction instances for the human annotations."""
 
     def __init__(self, skip_goto_rooms: bool = True, cdf_augmentation: bool = False) -> None:
-        self._clarification_target_extractor = ClarificationTargetExtractor()
         self.skip_goto_rooms = skip_goto_rooms
         self.cdf_augmentation = cdf_augmentation
 
@@ -168,12 +190,17 @@ class TrajectoryInstructionProcessor:
     ) -> list[dict[str, Any]]:
         """Run the preprocesing."""
         instruction_data = []
+        instructions = []
+        # Bind the attributes used in the loop to avoid repeated lookups for every instruction
+        skip_goto_rooms = self.skip_goto_rooms
+        cdf_augmentation = self.cdf_augmentation
         for human_idx, human_annotation in enumerate(human_annotations):
             for instruction in human_annotation["instructions"]:
-                if self.skip_goto_rooms and instruction_is_goto_room(instruction, actions):
-                    continue
-
                 action_types = get_action_types_for_instruction(instruction, actions)
+                if skip_goto_rooms and action_types_are_goto_room(  # noqa: WPS337
+                    action_types, instruction, actions
+                ):
+                    continue
 
                 # Ignore look around actions if they are the first action in an instruction
                 if action_types[0] == "Look":
@@ -182,7 +209,8 @@ class TrajectoryInstructionProcessor:
                         continue  # noqa: WPS220
                     instruction["actions"] = instruction["actions"][1:]
 
-                if "Look" in action_types[1:]:
+                # Check the remaining action types without copying them into a new list
+                if "Look" in islice(action_types, 1, None):
                     continue
 
                 instruction_dict = create_instruction_dict(
@@ -191,15 +219,27 @@ class TrajectoryInstructionProcessor:
                     mission_id=mission_id,
                     annotation_id=str(human_idx),
                     instruction_id=str(instruction_idx),
-                    clarification_extractor=self._clarification_target_extractor,
                     synthetic=False,
-                    cdf_augmentation=self.cdf_augmentation,
+                    cdf_augmentation=cdf_augmentation,
                     cdf_highlevel_key=cdf_highlevel_key,
                 )
                 instruction_data.append(instruction_dict)
+                instructions.append(instruction)
                 instruction_idx += 1
+
+        # The instruction dicts keep a reference to their instruction, so the question answers are
+        # updated in place
+        if instructions:
+            prepare_instructions_question_answers(
+                self._clarification_target_extractor, instructions
+            )
         return instruction_data
 
+    @cached_property
+    def _clarification_target_extractor(self) -> ClarificationTargetExtractor:
+        """Load the clarification target extractor only when it is first needed."""
+        return ClarificationTargetExtractor()
+
 
 class SyntheticIntructionsPreprocessor:
     """Preprocess the instruction instances for the human annotations."""
@@ -226,13 +266,22 @@ class SyntheticIntructionsPreprocessor:
     ) -> list[dict[str, Any]]:
         """Run the preprocesing."""
         instruction_data = []
+        # Bind the attributes used in the loop to avoid repeated lookups for every instruction
+        skip_goto_rooms = self.skip_goto_rooms
+        use_synthetic_action_sampler = self.use_synthetic_action_sampler
+        num_additional_instructions = self.num_additionalinstructions
+        ambiguous_goto_processor = self._ambiguous_goto_processor
+        synthetic_action_sampler = self._synthetic_action_sampler
 
         for annot_idx, synthetic_annotation in enumerate(synthetic_annotations):
             for instruction in synthetic_annotation["instructions"]:
-                if self.skip_goto_rooms and instruction_is_goto_room(instruction, actions):
+                action_types = get_action_types_for_instruction(instruction, actions)
+                if skip_goto_rooms and action_types_are_goto_room(  # noqa: WPS337
+                    action_types, instruction, actions
+                ):
                     continue
 
-                if instruction_is_look(instruction, actions):
+                if action_types_are_look(action_types):
                     continue
 
                 instruction_dict = create_instruction_dict(
@@ -245,7 +294,7 @@ class SyntheticIntructionsPreprocessor:
                 )
 
                 instruction_data.extend(
-                    self._ambiguous_goto_processor(
+                    ambiguous_goto_processor(
                         instruction_dict=instruction_dict,
                         mission_id=mission_id,
                         action=actions[instruction["actions"][0]],
@@ -254,11 +303,11 @@ class SyntheticIntructionsPreprocessor:
                 instruction_idx += 1
 
                 add_synthetic_instructions = (
-                    self.num_additionalinstructions == -1
-                    or self.total_sampled_actions < self.num_additionalinstructions
+                    num_additional_instructions == -1
+                    or self.total_sampled_actions < num_additional_instructions
                 )
-                if self.use_synthetic_action_sampler and add_synthetic_instructions:
-                    instruction_dict = self._synthetic_action_sampler(
+                if use_synthetic_action_sampler and add_synthetic_instructions:
+                    instruction_dict = synthetic_action_sampler(
                         mission_id=mission_id,
                         annotation_id=f"synthetic_{annot_idx}",
                         instruction_idx=instruction_idx,
@@ -11,20 +11,34 @@ from emma_datasets.datamodels.constants import MediaType
 
 settings = Settings()
 
-ParaphrasableActions = {
-    "goto",
-    "toggle",
-    "open",
-    "close",
-    "pickup",
-    "place",
-    "search",
-    "pour",
-    "fill",
-    "clean",
-    "scan",
-    "break",
-}
+ParaphrasableActions = frozenset(
+    (
+        "goto",
+        "toggle",
+        "open",
+        "close",
+        "pickup",
+        "place",
+        "search",
+        "pour",
+        "fill",
+        "clean",
+        "scan",
+        "break",
+    )
+)
+
+
+def get_image_stem(image_path: str) -> str:
+    """Get the name of an image file without its suffix.
+
+    This is equivalent to `Path(image_path).stem` without creating a new path object.
+    """
+    image_name = image_path.rpartition("/")[2]
+    suffix_start = image_name.rfind(".")
+    if 0 < suffix_start < len(image_name) - 1:
+        return image_name[:suffix_start]
+    return image_name
 
 
 class SimBotClarificationTypes(Enum):
@@ -168,31 +182,22 @@ class SimBotInstructionInstance(BaseInstance):
         belong to multiple instances, to avoid duplicates the feature path is directly the path to
         the image.
         """
+        features_dir = settings.paths.simbot_features
         # The instance comes from the vision data augmentations
         if self.vision_augmentation:
-            template = "{feature_path}.pt"
             color_image = self.actions[0].color_images[0]
-            feature_path = Path(color_image).stem
-            return [
-                settings.paths.simbot_features.joinpath(template.format(feature_path=feature_path))
-            ]
+            return [features_dir.joinpath(f"{get_image_stem(color_image)}.pt")]
 
         # The instance comes from the cdf augmentations
         elif self.cdf_augmentation:
-            template = "{feature_path}.pt"
-            color_images = [action.color_images[0] for action in self.actions]
-            feature_paths = [Path(color_image).stem for color_image in color_images]
             return [
-                settings.paths.simbot_features.joinpath(template.format(feature_path=feature_path))
-                for feature_path in feature_paths
+                features_dir.joinpath(f"{get_image_stem(action.color_images[0])}.pt")
+                for action in self.actions
             ]
 
         # The instance comes from the simbot annotations
-        template = "{mission_id}_action{action_id}.pt"
         return [
-            settings.paths.simbot_features.joinpath(
-                template.format(mission_id=self.mission_id, action_id=action.id)
-            )
+            features_dir.joinpath(f"{self.mission_id}_action{action.id}.pt")
             for action in self.actions
         ]
 
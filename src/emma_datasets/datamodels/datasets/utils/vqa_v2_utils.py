@@ -4,6 +4,7 @@ From the official evaluation code at https://github.com/GT-Vision-
 Lab/VQA/blob/master/PythonEvaluationTools/vqaEvaluation/vqaEval.py.
 """
 import re
+import sys
 
 
 contractions = {
@@ -142,7 +143,7 @@ digit_map = {
     "nine": "9",
     "ten": "10",
 }
-articles = ["a", "an", "the"]
+articles = frozenset(("a", "an", "the"))
 
 
 period_strip = re.compile(r"(?!<=\d)(\.)(?!\d)")
@@ -170,27 +171,32 @@ punctuations = [
     "?",
     "!",
 ]
+punctuation_set = frozenset(punctuations)
 
 
 def normalize_answer(answer: str) -> str:
-    """Normalize a VQA answer."""
+    """Normalize a VQA answer.
+
+    The normalized answer is interned, since the same few thousand answers repeat across millions
+    of questions.
+    """
     answer = answer.replace("\n", " ")
     answer = answer.replace("\t", " ")
     answer = answer.strip()
     answer = process_digit_article(process_punctuation(answer))
-    return answer
+    return sys.intern(answer)
 
 
 def process_punctuation(in_text: str) -> str:
     """Process the answer punctuation."""
     out_text = in_text
-    for punct in punctuations:
-        punct_cond1 = f"{punct} " in in_text or f" {punct}" in in_text
-        punct_cond2 = re.search(comma_strip, in_text) is not None
-        if punct_cond1 or punct_cond2:
-            out_text = out_text.replace(punct, "")
-        else:
-            out_text = out_text.replace(punct, " ")
+    if not punctuation_set.isdisjoint(in_text):
+        strip_all = comma_strip.search(in_text) is not None
+        punct_table = {}
+        for punct in punctuations:
+            punct_cond1 = f"{punct} " in in_text or f" {punct}" in in_text
+            punct_table[ord(punct)] = "" if punct_cond1 or strip_all else " "
+        out_text = out_text.translate(punct_table)
     out_text = period_strip.sub("", out_text, re.UNICODE)
     return out_text
 
@@ -199,10 +205,7 @@ def process_digit_article(in_text: str) -> str:
     """Preprocess digits and articles."""
     out_text = []
     for word in in_text.lower().split():
-        word = digit_map.setdefault(word, word)
+        word = digit_map.get(word, word)
         if word not in articles:
-            out_text.append(word)
-
-    for word_id, word in enumerate(out_text):  # noqa: WPS440
-        out_text[word_id] = contractions.get(word, word)
+            out_text.append(contractions.get(word, word))
     return " ".join(out_text)
@@ -1,8 +1,11 @@
+import sys
 from collections import Counter
+from functools import lru_cache
+from multiprocessing.pool import Pool
 from pathlib import Path
-from typing import Any, Literal, Optional
+from typing import Any, Literal, NamedTuple, Optional
 
-from pydantic import BaseModel, PrivateAttr
+from pydantic import BaseModel
 
 from emma_datasets.common import Settings
 from emma_datasets.datamodels.base_model import BaseInstance
@@ -16,7 +19,7 @@ settings = Settings()
 VQAv2AnnotationsType = list[dict[str, Any]]
 
 
-class VQAv2AnnotationPaths(BaseModel):
+class VQAv2AnnotationPaths(NamedTuple):
     """VQA-v2 annotation paths for a dataset split."""
 
     split: DatasetSplit
@@ -77,6 +80,15 @@ class VQAv2Target(BaseModel):
     target_id: Optional[int]
     score: Optional[float]
 
+    class Config:
+        """Do not copy the targets when validating the instances that contain them."""
+
+        copy_on_model_validation = "none"
+
+
+# Scores for answers that appear 0 to 10 times, indexed by the answer count
+VQA_V2_SCORES = tuple(min(1.0, round(0.3 * count, 1)) for count in range(11))  # noqa: WPS432
+
 
 def vqa_v2_score(count: int) -> float:
     """VQA-v2 includes 10 answers for each question.
@@ -87,17 +99,33 @@ def vqa_v2_score(count: int) -> float:
     - 0.9 if the answer appears three times
     - 1.0 if the answer appears more than three times
     """
-    return min(1.0, round(0.3 * count, 1))  # noqa: WPS432
+    if count < len(VQA_V2_SCORES):
+        return VQA_V2_SCORES[count]
+    return 1.0
+
+
+@lru_cache(maxsize=1)
+def get_vqa_v2_ans2label() -> dict[str, int]:
+    """Load the mapping from VQA-v2 answers to label ids.
+
+    The answers are interned to match the interned normalized answers.
+    """
+    ans2label = read_json(settings.paths.constants.joinpath("vqa_v2_ans2label.json"))
+    return {sys.intern(answer): label for answer, label in ans2label.items()}
 
 
 def prepare_training_targets(answers: list[str], ans2label: dict[str, int]) -> list[VQAv2Target]:
     """Compute answer VQA scores for answers in the predifined candidates."""
+    if ans2label.keys().isdisjoint(answers):
+        return []
+
     targets = []
     for answer, count in Counter(answers).items():
         label = ans2label.get(answer, -1)
         if label > 0:
+            # The targets are built from trusted values, so skip the pydantic validation
             targets.append(
-                VQAv2Target(
+                VQAv2Target.construct(
                     target_id=label,
                     score=vqa_v2_score(count),
                     answer=answer,
@@ -106,31 +134,44 @@ def prepare_training_targets(answers: list[str], ans2label: dict[str, int]) -> l
     return targets
 
 
+def align_vqa_v2_answers(
+    questions: VQAv2AnnotationsType, all_answers: VQAv2AnnotationsType
+) -> VQAv2AnnotationsType:
+    """Order the answer annotations to match the question annotations.
+
+    The official files list questions and answers in the same order, in which case the answers
+    are returned as they are.
+    """
+    question_ids = [question["question_id"] for question in questions]
+    if question_ids == [answers["question_id"] for answers in all_answers]:
+        return all_answers
+
+    answers_per_question = {str(answers["question_id"]): answers for answers in all_answers}
+    aligned_answers = []
+    for question in questions:
+        question_id = str(question["question_id"])
+        if question_id not in answers_per_question:
+            raise AssertionError(f"Annotations for question {question_id} not found!")
+        aligned_answers.append(answers_per_question[question_id])
+    return aligned_answers
+
+
 def merge_vqa_v2_annotations(
-    questions: dict[str, Any], all_answers: dict[str, Any]
-) -> dict[str, Any]:
+    questions: VQAv2AnnotationsType, all_answers: VQAv2AnnotationsType
+) -> VQAv2AnnotationsType:
     """Merge question and answer annotations for VQA-v2."""
-    ans2label_path = settings.paths.constants.joinpath("vqa_v2_ans2label.json")
-    ans2label = read_json(ans2label_path)
-    for question_id in questions.keys():
-        answers = all_answers.get(question_id, None)
-        if answers is None:
-            raise AssertionError(f"Annotations for question {question_id} not found!")
-        questions[question_id]["answer_type"] = answers.get("answer_type", None)
-        questions[question_id]["question_type"] = answers.get("question_type", None)
+    ans2label = get_vqa_v2_ans2label()
+    for question, answers in zip(questions, align_vqa_v2_answers(questions, all_answers)):
+        question["answer_type"] = answers.get("answer_type", None)
+        question["question_type"] = answers.get("question_type", None)
         # Keep only the answers, discard the answer condfindence and id
-        questions[question_id]["answers"] = [
-            normalize_answer(answer["answer"]) for answer in answers["answers"]
-        ]
+        normalized_answers = [normalize_answer(answer["answer"]) for answer in answers["answers"]]
         # All VQA-v2 instances should have 10 answers
-        if len(questions[question_id]["answers"]) != 10:
-            raise AssertionError(
-                f"Found {len(questions[question_id]['answers'])} answers instead of 10!"
-            )
+        if len(normalized_answers) != 10:
+            raise AssertionError(f"Found {len(normalized_answers)} answers instead of 10!")
 
-        questions[question_id]["training_targets"] = prepare_training_targets(
-            questions[question_id]["answers"], ans2label
-        )
+        question["answers"] = normalized_answers
+        question["training_targets"] = prepare_training_targets(normalized_answers, ans2label)
 
     return questions
 
@@ -144,13 +185,37 @@ def load_vqa_v2_annotations(
     Question and answer annotations are saved in separate files, but they can be merged based on
     their unique question id.
     """
-    questions = read_vqa_v2_json(questions_path, "questions")
+    questions = read_json(questions_path)["questions"]
+    if answers_path is None:
+        return questions
 
-    if answers_path is not None:
-        answers = read_vqa_v2_json(answers_path, "annotations")
-        questions = merge_vqa_v2_annotations(questions=questions, all_answers=answers)
+    answers = read_json(answers_path)["annotations"]
+    return merge_vqa_v2_annotations(questions=questions, all_answers=answers)
 
-    return list(questions.values())
+
+def load_vqa_v2_split_annotations(split_paths: VQAv2AnnotationPaths) -> VQAv2AnnotationsType:
+    """Load question and answer annotations for a VQA-v2 split."""
+    return load_vqa_v2_annotations(
+        questions_path=split_paths.questions_path, answers_path=split_paths.answers_path
+    )
+
+
+def load_vqa_v2_annotations_per_split(
+    vqa_v2_dir_paths: list[VQAv2AnnotationPaths], pool: Optional[Pool] = None
+) -> dict[DatasetSplit, VQAv2AnnotationsType]:
+    """Load the annotations for all VQA-v2 splits.
+
+    If a pool is provided, the splits are loaded in parallel.
+    """
+    annotations_per_split = (
+        pool.imap(load_vqa_v2_split_annotations, vqa_v2_dir_paths)
+        if pool is not None
+        else map(load_vqa_v2_split_annotations, vqa_v2_dir_paths)
+    )
+    return {
+        split_paths.split: split_annotations
+        for split_paths, split_annotations in zip(vqa_v2_dir_paths, annotations_per_split)
+    }
 
 
 def resplit_vqa_v2_annotations(
@@ -171,13 +236,12 @@ def resplit_vqa_v2_annotations(
         raise AssertionError(
             f"{valid_ids_path} does not exist. Download the validation ids from s3."
         )
-    vqa_valid_question_ids = read_json(valid_ids_path)["question_ids"]
+    vqa_valid_question_ids = frozenset(
+        str(question_id) for question_id in read_json(valid_ids_path)["question_ids"]
+    )
     new_valid_annotations = []
     for annotation in valid_annotations:
-        question_id = annotation["question_id"]
-        if isinstance(question_id, int):
-            question_id = str(question_id)
-        if question_id in vqa_valid_question_ids:
+        if str(annotation["question_id"]) in vqa_valid_question_ids:
             new_valid_annotations.append(annotation)
         else:
             train_annotations.append(annotation)
@@ -210,13 +274,6 @@ class VQAv2Instance(BaseInstance):
     answers: Optional[list[str]]
     answer_type: Optional[str]
     training_targets: Optional[list[VQAv2Target]]
-    _features_path: Path = PrivateAttr()
-
-    def __init__(self, **data: Any) -> None:
-        super().__init__(**data)
-        self._features_path = settings.paths.coco_features.joinpath(  # noqa: WPS601
-            f"{self.image_id.zfill(12)}.pt"  # noqa: WPS432
-        )
 
     @property
     def modality(self) -> MediaType:
@@ -226,4 +283,6 @@ class VQAv2Instance(BaseInstance):
     @property
     def features_path(self) -> Path:
         """Get the path to the features for this instance."""
-        return self._features_path
+        return settings.paths.coco_features.joinpath(
+            f"{self.image_id.zfill(12)}.pt"  # noqa: WPS432
+        )
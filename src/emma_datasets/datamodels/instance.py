@@ -1,5 +1,7 @@
 from pathlib import Path
-from typing import Optional, Union
+from typing import Any, Optional, TypeVar, Union
+
+from pydantic import PrivateAttr
 
 from emma_datasets.datamodels.annotations import (
     ActionTrajectory,
@@ -16,6 +18,8 @@ from emma_datasets.datamodels.dataset_metadata import DatasetMetadata
 
 DatasetDict = dict[DatasetName, DatasetMetadata]
 
+InstanceT = TypeVar("InstanceT", bound="MultiSourceInstanceMixin")
+
 
 class MultiSourceInstanceMixin(BaseInstance):
     """Mixin class exposing functionalities useful for instances based on multiple datasets."""
@@ -27,18 +31,30 @@ class MultiSourceInstanceMixin(BaseInstance):
     scene_graph: Optional[SceneGraph]
     trajectory: Optional[ActionTrajectory]
     task_description: Optional[list[TaskDescription]]
+    _modality: Optional[MediaType] = PrivateAttr(default=None)
+
+    def __setattr__(self, name: str, attr_value: Any) -> None:
+        """Set the attribute, clearing any cached values if a field has changed."""
+        super().__setattr__(name, attr_value)
+        if name in self.__fields__:
+            self._clear_cached_values()
+
+    def copy(self: InstanceT, *args: Any, **kwargs: Any) -> InstanceT:
+        """Copy the instance, clearing any cached values since the fields can be updated."""
+        instance_copy = super().copy(*args, **kwargs)
+        instance_copy._clear_cached_values()  # noqa: WPS437
+        return instance_copy
 
     @property
     def modality(self) -> MediaType:
-        """Returns the modality of the instance."""
-        instance_modalities = {
-            DatasetModalityMap[dataset_name] for dataset_name in self.dataset.keys()
-        }
+        """Returns the modality of the instance.
 
-        if len(instance_modalities) > 1:
-            return max(instance_modalities)
-
-        return next(iter(instance_modalities))
+        The modality only depends on the datasets of the instance, so it is cached until a field
+        is changed.
+        """
+        if self._modality is None:
+            self._modality = self._get_modality()  # noqa: WPS601
+        return self._modality
 
     @property
     def source_paths(self) -> Union[Path, list[Path], None]:
@@ -66,6 +82,17 @@ class MultiSourceInstanceMixin(BaseInstance):
             return False
         return isinstance(self.features_path, list) and len(self.features_path) > 1
 
+    def _clear_cached_values(self) -> None:
+        """Clear the values derived from the fields of the instance."""
+        self._modality = None  # noqa: WPS601
+
+    def _get_modality(self) -> MediaType:
+        # Most instances come from a single dataset
+        if len(self.dataset) == 1:
+            return DatasetModalityMap[next(iter(self.dataset))]
+
+        return max(DatasetModalityMap[dataset_name] for dataset_name in self.dataset)
+
 
 class Instance(MultiSourceInstanceMixin):
     """Instance within the dataset."""
@@ -76,28 +103,43 @@ class Instance(MultiSourceInstanceMixin):
     scene_graph: Optional[SceneGraph]
     trajectory: Optional[ActionTrajectory]
     task_description: Optional[list[TaskDescription]]
+    _language_annotations: Optional[list[str]] = PrivateAttr(default=None)
 
     @property
     def language_annotations(self) -> list[str]:
-        """Derives all the language annotations associated with a given instance."""
-        lang_data_iterable = []
+        """Derives all the language annotations associated with a given instance.
+
+        The annotations are cached until a field is changed, and the cached list is returned
+        directly. It must not be modified; copy it first if needed.
+        """
+        if self._language_annotations is None:
+            self._language_annotations = self._get_language_annotations()  # noqa: WPS601
+        return self._language_annotations
+
+    def _clear_cached_values(self) -> None:
+        """Clear the values derived from the fields of the instance."""
+        super()._clear_cached_values()
+        self._language_annotations = None  # noqa: WPS601
+
+    def _get_language_annotations(self) -> list[str]:
+        lang_data_iterable: list[str] = []
 
         if self.captions is not None:
-            lang_data_iterable.extend([caption.get_language_data() for caption in self.captions])
+            lang_data_iterable.extend(caption.get_language_data() for caption in self.captions)
 
         if self.qa_pairs is not None:
-            lang_data_iterable.extend([qa_pair.get_language_data() for qa_pair in self.qa_pairs])
+            lang_data_iterable.extend(qa_pair.get_language_data() for qa_pair in self.qa_pairs)
 
         if self.regions is not None:
-            lang_data_iterable.extend([region.get_language_data() for region in self.regions])
+            lang_data_iterable.extend(region.get_language_data() for region in self.regions)
 
         if self.scene_graph is not None:
             lang_data_iterable.extend(self.scene_graph.get_language_data())
 
         if self.trajectory is not None:
-            lang_data_iterable.extend(self.trajectory.get_language_data())
+            lang_data_iterable.append(self.trajectory.get_language_data())
 
         if self.task_description is not None:
-            lang_data_iterable.extend([desc.get_language_data() for desc in self.task_description])
+            lang_data_iterable.extend(desc.get_language_data() for desc in self.task_description)
 
         return lang_data_iterable
@@ -1,5 +1,7 @@
 import sqlite3
 from collections.abc import Iterable, Iterator
+from itertools import islice
+from multiprocessing.pool import Pool
 from pathlib import Path
 from types import TracebackType
 from typing import Any, Optional, Union
@@ -19,13 +21,33 @@ INSERT_DATA_TABLE_FORMAT = """
 """
 
 SELECT_INDEX_FORMAT = """
-    SELECT data FROM dataset WHERE data_id = ?;
+    SELECT data FROM dataset WHERE data_id = ? LIMIT 1;
+"""
+
+SELECT_INDICES_FORMAT = """
+    SELECT data_id, data FROM dataset WHERE data_id IN ({placeholders});
 """
 
 SELECT_EXID_FORMAT = """
-    SELECT data FROM dataset WHERE example_id = ?;
+    SELECT data FROM dataset WHERE example_id = ? LIMIT 1;
 """
 
+# Memory-map up to 1GiB of the database and use a 256MiB page cache for read-only connections
+READONLY_PRAGMAS = (
+    "PRAGMA mmap_size = 1073741824;",
+    "PRAGMA cache_size = -262144;",
+)
+
+# The DB is rebuilt from scratch if preprocessing fails, so writes skip fsync and the on-disk
+# rollback journal. Neither setting is persisted in the database file.
+WRITE_PRAGMAS = (
+    "PRAGMA synchronous = OFF;",
+    "PRAGMA journal_mode = MEMORY;",
+)
+
+# Maximum number of host parameters in a single SQLite statement for SQLite < 3.32
+MAX_QUERY_PARAMETERS = 999
+
 COUNT_INSTANCES = """
     SELECT COUNT(data_id) from dataset;
 """
@@ -75,6 +97,7 @@ class DatasetDb:
         self._env: sqlite3.Connection
         self._write_count: int = 0
         self._cache: list[Any] = []
+        self._len: Optional[int] = None
 
     def iterkeys(self) -> Iterable[tuple[int, str]]:
         """Returns an iterator over the keys of the dataset."""
@@ -106,6 +129,34 @@ class DatasetDb:
             self._cache.clear()
             self._write_count = 0
 
+    def extend(
+        self, db_items: Iterable[tuple[tuple[int, str], Any]], pool: Optional[Pool] = None
+    ) -> None:
+        """Inserts multiple (key, value) pairs in the database.
+
+        The values are compressed and written in batches of `batch_size`. If a pool is provided,
+        the values of each batch are compressed in parallel.
+        """
+        self.open()
+
+        if self.readonly:
+            raise ValueError("readonly text DB")
+
+        db_items_iterator = iter(db_items)
+        batch = list(islice(db_items_iterator, self._batch_size))
+        while batch:
+            db_keys = [db_key for db_key, _ in batch]
+            db_values = [db_value for _, db_value in batch]
+            compressed_values = (
+                pool.map(self._storage_type.compress, db_values)
+                if pool is not None
+                else map(self._storage_type.compress, db_values)
+            )
+            self._cache.extend((*db_key, data) for db_key, data in zip(db_keys, compressed_values))
+            self._write_count += len(batch)
+            self.flush()
+            batch = list(islice(db_items_iterator, self._batch_size))
+
     def update(self, data_id: int, example_id: str) -> None:
         """Updates the data_id column with a new one for the example."""
         with self._env:
@@ -143,13 +194,7 @@ class DatasetDb:
         """Verifies whether a given key is contained in the dataset."""
         self.open()
 
-        if isinstance(key, int):
-            # in this case we assume we're using directly an index
-            query_format = SELECT_INDEX_FORMAT
-        else:
-            query_format = SELECT_EXID_FORMAT
-
-        db_result = self._env.execute(query_format, (str(key),))
+        db_result = self._env.execute(*self._get_select_query(key))
 
         return db_result.fetchone() is not None
 
@@ -157,25 +202,41 @@ class DatasetDb:
         """Returns the object associated with a given key."""
         self.open()
 
-        if isinstance(key, int):
-            # in this case we assume we're using directly an index
-            query_format = SELECT_INDEX_FORMAT
-        else:
-            query_format = SELECT_EXID_FORMAT
+        db_result = self._env.execute(*self._get_select_query(key)).fetchone()
 
-        db_result = self._env.execute(query_format, (str(key),))
+        if db_result is None:
+            raise KeyError(f"No record for key: '{key}'")
 
-        db_item = None
-        for res in db_result:
-            db_item = res[0]
+        return self._storage_type.decompress(db_result[0])
 
-        if db_item is None:
-            raise KeyError(f"No record for key: '{key}'")
+    def __getitems__(self, keys: list[int]) -> list[Any]:
+        """Returns the objects associated with a list of indices.
+
+        The objects are fetched with a single query per `MAX_QUERY_PARAMETERS` keys, which is
+        faster than accessing them one by one (e.g., when used by a PyTorch DataLoader).
+        """
+        self.open()
 
-        return self._storage_type.decompress(db_item)
+        db_items: dict[int, bytes] = {}
+        for start_idx in range(0, len(keys), MAX_QUERY_PARAMETERS):
+            batch_keys = keys[start_idx : start_idx + MAX_QUERY_PARAMETERS]
+            query = SELECT_INDICES_FORMAT.format(placeholders=", ".join("?" * len(batch_keys)))
+            db_items.update(self._env.execute(query, batch_keys))
+
+        missing_keys = [key for key in keys if key not in db_items]
+        if missing_keys:
+            raise KeyError(f"No record for keys: {missing_keys}")
+
+        return self._storage_type.decompress_many([db_items[key] for key in keys])
 
     def __len__(self) -> int:
-        """Returns the number of instances in the database."""
+        """Returns the number of instances in the database.
+
+        The length of a read-only database is only counted once.
+        """
+        if self.readonly and self._len is not None:
+            return self._len
+
         self.open()
 
         self.flush()
@@ -183,7 +244,8 @@ class DatasetDb:
 
         res = next(res_it)
 
-        return res[0] if res is not None else 0
+        self._len = res[0] if res is not None else 0
+        return self._len
 
     def __delitem__(self, key: tuple[int, str]) -> None:  # noqa: WPS603
         """Removes an instance from the database having a specific key."""
@@ -193,6 +255,8 @@ class DatasetDb:
         with self._env:
             self._env.execute(DELETE_EXAMPLES, (key,))
 
+        self._len = None
+
     def __setitem__(self, key: tuple[int, str], db_value: Any) -> None:
         """Inserts a new instance in the database using the specified (key, value)."""
         self.open()
@@ -207,9 +271,19 @@ class DatasetDb:
         self._write_count += 1
         self._cache.append((data_id, example_id, data))
 
-        if self._write_count > 1 and self._write_count % self._batch_size == 0:
+        if self._write_count >= self._batch_size:
             self.flush()
 
+    def _get_select_query(
+        self, key: Union[int, tuple[int, str]]
+    ) -> tuple[str, tuple[Union[int, str]]]:
+        """Returns the query and its parameters to select the data for a given key."""
+        if isinstance(key, int):
+            # in this case we assume we're using directly an index, which is compared as an integer
+            return SELECT_INDEX_FORMAT, (key,)
+
+        return SELECT_EXID_FORMAT, (str(key),)
+
     def _get_storage_type(self, storage_type: StorageType) -> DataStorage:
         """Returns the data storage used to serialise the instances of this dataset."""
         if storage_type == StorageType.json:
@@ -253,9 +327,13 @@ class DatasetDb:
             # training
             self._write_count = 0
             self._cache = []
+            for readonly_pragma in READONLY_PRAGMAS:
+                self._env.execute(readonly_pragma)
         else:
             # prepro
             self._write_count = 0
             self._cache = []
+            for write_pragma in WRITE_PRAGMAS:
+                self._env.execute(write_pragma)
             self._create_tables()
             self._create_indexes()
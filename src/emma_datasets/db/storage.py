@@ -1,6 +1,9 @@
 import io
+import os
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
+from functools import lru_cache
 from lzma import compress, decompress
 from typing import Any
 
@@ -21,6 +24,20 @@ except ImportError:
     )
 
 
+@lru_cache(maxsize=None)
+def get_decompression_executor(process_id: int) -> ThreadPoolExecutor:
+    """Get the thread pool used to decompress items within the given process.
+
+    The executor is cached per process id so that forked processes (e.g., DataLoader workers) do
+    not reuse the threads of their parent.
+    """
+    try:
+        num_cpus = len(os.sched_getaffinity(0))
+    except AttributeError:
+        num_cpus = os.cpu_count() or 1
+    return ThreadPoolExecutor(max_workers=num_cpus)
+
+
 class StorageType(Enum):
     """Different serialisation formats for objects in SQLite database."""
 
@@ -41,6 +58,10 @@ class DataStorage(ABC):
         """Given a byte representation of an object, returns the original object representation."""
         raise NotImplementedError
 
+    def decompress_many(self, data_bufs: list[bytes]) -> list[Any]:
+        """Given a list of byte representations, returns the original objects."""
+        return [self.decompress(data_buf) for data_buf in data_bufs]
+
     @abstractmethod
     def compress(self, data: Any) -> bytes:
         """Given an object representation, returns a compressed byte representation."""
@@ -56,6 +77,17 @@ class JsonStorage(DataStorage):
         """Decompress using LZMA and then loads the underlying bytes using orjson."""
         return orjson.loads(decompress(data_buf))
 
+    def decompress_many(self, data_bufs: list[bytes]) -> list[Any]:
+        """Decompress multiple objects, running LZMA in a thread pool.
+
+        LZMA releases the GIL while decompressing, so the buffers can be decompressed in parallel.
+        """
+        if len(data_bufs) < 2:
+            return super().decompress_many(data_bufs)
+
+        executor = get_decompression_executor(os.getpid())
+        return [orjson.loads(json_buf) for json_buf in executor.map(decompress, data_bufs)]
+
     def compress(self, data: Any) -> bytes:
         """Uses orjson + LZMA compression to generate a byte representation of the object.
 
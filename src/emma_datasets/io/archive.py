@@ -1,18 +1,69 @@
 import logging
+import math
+import os
 import tarfile
 from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Optional, TypeVar
 from zipfile import ZipFile, ZipInfo
 
 from py7zr import SevenZipFile
+from py7zr.callbacks import ExtractCallback
 from rich.progress import Progress, TaskID
 
+from emma_datasets.common.progress import BatchedProgress
+
 
 logger = logging.getLogger(__name__)
 
+try:
+    import rapidgzip  # noqa: WPS433
+except ImportError:
+    rapidgzip = None  # noqa: WPS440
+
 T = TypeVar("T", tarfile.TarInfo, ZipInfo)
 
+# Each thread extracting a zip archive opens its own handle, so only add one per this many files
+MIN_FILES_PER_EXTRACTION_WORKER = 32
+
+GZIP_TAR_SUFFIXES = (".tar.gz", ".tgz")
+TAR_SUFFIXES = (".tar", *GZIP_TAR_SUFFIXES)
+
+
+class SevenZipProgressCallback(ExtractCallback):
+    """Advance the progress bar as each file is written out of a 7z archive.
+
+    Directories are also reported by `py7zr`, so only the given file names advance the progress.
+    """
+
+    def __init__(self, progress: BatchedProgress, file_names: frozenset[str]) -> None:
+        self._progress = progress
+        self._file_names = file_names
+
+    def report_start_preparation(self) -> None:
+        """Nothing to report before the archive is prepared."""
+
+    def report_start(self, processing_file_path: str, processing_bytes: str) -> None:
+        """Nothing to report when a file starts being extracted."""
+
+    def report_update(self, decompressed_bytes: str) -> None:
+        """Nothing to report while a file is being decompressed."""
+
+    def report_end(self, processing_file_path: str, wrote_bytes: str) -> None:
+        """Advance the progress once the file has been written."""
+        if processing_file_path in self._file_names:
+            self._progress.advance(comment=f"Extracting {processing_file_path}")
+
+    def report_warning(self, message: str) -> None:
+        """Log any warnings raised during extraction."""
+        logger.warning(message)
+
+    def report_postprocess(self) -> None:
+        """Pass on any remaining progress once all the files have been extracted."""
+        self._progress.flush()
+
 
 class ExtractArchive:
     """Function to extract files from the archive.
@@ -48,7 +99,7 @@ class ExtractArchive:
         if path.name.endswith(".zip"):
             self.extract_from_zip(path, output_dir, task_id, progress, move_files_to_output_dir)
 
-        if path.name.endswith(".tar") or path.name.endswith(".tar.gz"):
+        if path.name.endswith(TAR_SUFFIXES):
             self.extract_from_tar(path, output_dir, task_id, progress, move_files_to_output_dir)
 
         if path.name.endswith(".7z"):
@@ -75,18 +126,37 @@ class ExtractArchive:
 
             self._start_progress(progress, task_id, len(all_files))
 
-            archive_file.extractall(
-                output_dir,
-                members=self.members_iterator(
-                    all_files,
-                    file_name_attr="filename",
-                    is_dir_attr="is_dir",
-                    output_dir=output_dir,
-                    task_id=task_id,
-                    progress=progress,
-                    move_files_to_output_dir=move_files_to_output_dir,
-                ),
+        num_workers = min(
+            os.cpu_count() or 1, math.ceil(len(all_files) / MIN_FILES_PER_EXTRACTION_WORKER)
+        )
+        if num_workers <= 1:
+            self._extract_zip_members(
+                path, all_files, output_dir, task_id, progress, move_files_to_output_dir
             )
+            return
+
+        # Create the directories upfront so that the workers never race on creating them
+        extracted_dirs = {output_dir.joinpath(member.filename).parent for member in all_files}
+        for extracted_dir in extracted_dirs:
+            extracted_dir.mkdir(parents=True, exist_ok=True)
+
+        # Each worker opens its own handle to the archive, since they are not thread-safe
+        with ThreadPoolExecutor(max_workers=num_workers) as executor:
+            futures = [
+                executor.submit(
+                    self._extract_zip_members,
+                    path,
+                    all_files[worker_idx::num_workers],
+                    output_dir,
+                    task_id,
+                    progress,
+                    move_files_to_output_dir,
+                )
+                for worker_idx in range(num_workers)
+            ]
+
+        for future in futures:
+            future.result()
 
     def extract_from_tar(
         self,
@@ -97,7 +167,7 @@ class ExtractArchive:
         move_files_to_output_dir: bool,
     ) -> None:
         """Extract all files from within a tar archive."""
-        with tarfile.open(path) as tar_file:
+        with self._open_tar_file(path) as tar_file:
             progress.update(task_id, visible=True, comment="Getting file list")
 
             all_files = tar_file.getmembers()
@@ -153,17 +223,12 @@ class ExtractArchive:
 
             progress.start_task(task_id)
 
-            for file_name, binary_file in zip_file.read(targets=all_files).items():
-                progress.update(task_id, comment=f"Extracting {file_name}")
-
-                file_path = Path(file_name)
-                extracted_path = output_dir.joinpath(file_path.parent)
-                extracted_path.mkdir(parents=True, exist_ok=True)
-
-                with open(extracted_path.joinpath(file_path.name), "wb") as output_file:
-                    output_file.write(binary_file.getbuffer())
-
-                progress.advance(task_id)
+            zip_file.extractall(  # noqa: S202
+                path=output_dir,
+                callback=SevenZipProgressCallback(
+                    BatchedProgress(progress, task_id), frozenset(all_files)
+                ),
+            )
 
     def members_iterator(
         self,
@@ -176,9 +241,10 @@ class ExtractArchive:
         move_files_to_output_dir: bool,
     ) -> Iterator[T]:
         """Iterate through members of an archive, moving if needed and updating the progress."""
+        batched_progress = BatchedProgress(progress, task_id)
+
         for member in members:
             filename: str = getattr(member, file_name_attr)
-            progress.update(task_id, comment=f"Extracting {filename}")
 
             yield member
 
@@ -188,7 +254,45 @@ class ExtractArchive:
                 if not getattr(member, is_dir_attr)() and extracted_path.parent != output_dir:
                     extracted_path.rename(output_dir.joinpath(extracted_path.name))
 
-            progress.advance(task_id)
+            batched_progress.advance(comment=f"Extracting {filename}")
+
+        batched_progress.flush()
+
+    def _extract_zip_members(
+        self,
+        path: Path,
+        members: list[ZipInfo],
+        output_dir: Path,
+        task_id: TaskID,
+        progress: Progress,
+        move_files_to_output_dir: bool,
+    ) -> None:
+        """Extract the given members from a zip archive."""
+        with ZipFile(path) as archive_file:
+            archive_file.extractall(
+                output_dir,
+                members=self.members_iterator(
+                    members,
+                    file_name_attr="filename",
+                    is_dir_attr="is_dir",
+                    output_dir=output_dir,
+                    task_id=task_id,
+                    progress=progress,
+                    move_files_to_output_dir=move_files_to_output_dir,
+                ),
+            )
+
+    @contextmanager
+    def _open_tar_file(self, path: Path) -> Iterator[tarfile.TarFile]:
+        """Open a tar archive, decompressing gzip across all cores if `rapidgzip` is installed."""
+        if rapidgzip is None or not path.name.endswith(GZIP_TAR_SUFFIXES):
+            with tarfile.open(path) as tar_file:
+                yield tar_file
+            return
+
+        with rapidgzip.open(str(path), parallelization=os.cpu_count()) as gzip_file:
+            with tarfile.open(fileobj=gzip_file, mode="r:") as rapid_tar_file:
+                yield rapid_tar_file
 
     def _start_progress(self, progress: Progress, task_id: TaskID, updated_total: int) -> None:
         progress.start_task(task_id)
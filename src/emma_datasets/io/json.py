@@ -8,8 +8,11 @@ DEFAULT_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.
 
 
 def read_json(path: Union[str, Path]) -> Any:
-    """Read JSON file and return."""
-    with open(path) as json_file:
+    """Read JSON file and return.
+
+    The file is read as bytes so that orjson can parse it without decoding it to a string first.
+    """
+    with open(path, "rb") as json_file:
         data = orjson.loads(json_file.read())
     return data
 
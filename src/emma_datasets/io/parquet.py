@@ -1,10 +1,13 @@
 from pathlib import Path
-from typing import Union
+from typing import Optional, Union
 
 import pandas as pd
 
 
-def read_parquet(path: Union[str, Path]) -> pd.DataFrame:
-    """Read a parquet file using pandas."""
-    data = pd.read_parquet(path)
+def read_parquet(path: Union[str, Path], columns: Optional[list[str]] = None) -> pd.DataFrame:
+    """Read a parquet file using pandas.
+
+    If columns are provided, only those columns are read from the file.
+    """
+    data = pd.read_parquet(path, columns=columns)
     return data
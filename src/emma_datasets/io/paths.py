@@ -1,4 +1,5 @@
 import itertools
+import os
 from collections.abc import Iterable, Iterator
 from pathlib import Path
 from typing import Union
@@ -19,10 +20,23 @@ def get_paths_from_dir(dir_path: Path) -> Iterator[Path]:
     if not dir_path.is_dir():
         raise RuntimeError("`dir_path` should point to a directory.")
 
-    paths_from_dir = dir_path.rglob("*.*")
-    files_from_dirs = (file_path for file_path in paths_from_dir if file_path.is_file())
+    return _scan_files_from_dir(dir_path)
 
-    return files_from_dirs
+
+def _scan_files_from_dir(dir_path: Path) -> Iterator[Path]:  # noqa: WPS231
+    """Recursively yield the files with an extension, like `dir_path.rglob("*.*")`.
+
+    `os.scandir` reuses the file types returned when listing each directory, instead of calling
+    `stat` on every path. As with `rglob`, symlinks to directories are not followed.
+    """
+    dirs_to_scan = [dir_path]
+    while dirs_to_scan:
+        with os.scandir(dirs_to_scan.pop()) as dir_entries:
+            for dir_entry in dir_entries:
+                if dir_entry.is_dir(follow_symlinks=False):
+                    dirs_to_scan.append(Path(dir_entry.path))
+                elif "." in dir_entry.name and dir_entry.is_file():
+                    yield Path(dir_entry.path)
 
 
 def convert_strings_to_paths(string_paths: Iterable[str]) -> Iterable[Path]:
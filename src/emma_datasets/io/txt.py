@@ -5,6 +5,6 @@ from typing import Union
 def read_txt(path: Union[str, Path]) -> list[str]:
     """Read a txt file and return a list of strings."""
     with open(path) as fp:
-        raw_lines = [line.strip() for line in fp.readlines()]
+        raw_lines = [line.strip() for line in fp]
 
     return raw_lines
@@ -1,15 +1,17 @@
 import itertools
-from collections import ChainMap
-from collections.abc import Iterable, Iterator
+from collections.abc import Iterable, Iterator, KeysView
 
 from rich.progress import Progress
 
+from emma_datasets.common.progress import BatchedProgress
 from emma_datasets.datamodels import DatasetMetadata, DatasetName
 from emma_datasets.parsers.dataset_aligner import DatasetAlignerReturn
 
 
 CommonDatasetMapping = dict[str, dict[DatasetName, DatasetMetadata]]
 
+NON_COMMON_CHUNK_SIZE = 1024
+
 
 class AlignMultipleDatasets:
     """Align multiple aligned datasets, returning grouped of metadata per instance."""
@@ -43,15 +45,21 @@ class AlignMultipleDatasets:
             for aligned_metadata in aligned_metadata_iterable
         ]
 
-        aligned_common_ids = self.get_common_aligned_ids(all_common_dataset_mapping)
+        all_common_ids: list[KeysView[str]] = [
+            mapping.keys() for mapping in all_common_dataset_mapping
+        ]
+
+        aligned_common_ids = self.get_common_aligned_ids(all_common_ids)
         non_aligned_common_ids = self.get_non_aligned_common_ids(
-            all_common_dataset_mapping, aligned_common_ids
+            all_common_ids, aligned_common_ids
         )
 
         self.progress.reset(
             self.task_id,
             start=True,
-            total=self._calculate_total(all_common_dataset_mapping, aligned_metadata_iterable),
+            total=self._calculate_total(
+                aligned_common_ids, non_aligned_common_ids, aligned_metadata_iterable
+            ),
             visible=True,
         )
 
@@ -71,24 +79,35 @@ class AlignMultipleDatasets:
         self, all_common_dataset_mapping: list[CommonDatasetMapping], aligned_ids: set[str]
     ) -> Iterator[list[DatasetMetadata]]:
         """Get all scenes which align across all datasets."""
+        batched_progress = BatchedProgress(self.progress, self.task_id)
+
         for aligned_id in aligned_ids:
-            instance = dict(
-                ChainMap(*(mapping[aligned_id] for mapping in all_common_dataset_mapping))
-            ).values()
+            # Merge in reverse so the first mapping takes priority, as with a `ChainMap`
+            instance: dict[DatasetName, DatasetMetadata] = {}
+            for mapping in reversed(all_common_dataset_mapping):
+                instance.update(mapping[aligned_id])
 
-            self.progress.advance(self.task_id)
-            yield list(instance)
+            batched_progress.advance()
+            yield list(instance.values())
+
+        batched_progress.flush()
 
     def get_all_non_common_instances(
         self, all_common_dataset_mapping: list[CommonDatasetMapping], aligned_ids: set[str]
     ) -> Iterator[list[DatasetMetadata]]:
-        """Get all instances which cannot be aligned with the common dataset."""
+        """Get all instances which cannot be aligned with the common dataset.
+
+        Instances are built in chunks so that the progress only needs updating once per chunk.
+        """
         for mapping in all_common_dataset_mapping:
-            non_overlapping_ids = set(mapping.keys()) - aligned_ids
+            non_overlapping_ids = list(mapping.keys() - aligned_ids)
 
-            for non_common_id in non_overlapping_ids:
-                self.progress.advance(self.task_id)
-                yield list(mapping[non_common_id].values())
+            for chunk_start in range(0, len(non_overlapping_ids), NON_COMMON_CHUNK_SIZE):
+                chunk_ids = non_overlapping_ids[chunk_start : chunk_start + NON_COMMON_CHUNK_SIZE]
+                instances = [list(mapping[non_common_id].values()) for non_common_id in chunk_ids]
+
+                self.progress.advance(self.task_id, len(instances))
+                yield from instances
 
     def get_all_non_alignable_instances(
         self, aligned_metadata_iterable: Iterable[DatasetAlignerReturn], non_common_ids: set[str]
@@ -98,6 +117,8 @@ class AlignMultipleDatasets:
 
         existing_common_dataset_ids = set() | non_common_ids
 
+        batched_progress = BatchedProgress(self.progress, self.task_id)
+
         for non_aligned in itertools.chain.from_iterable(non_aligned_metadata):
             if self.common_dataset in non_aligned:
                 metadata_id = non_aligned[self.common_dataset].id  # noqa: WPS529
@@ -107,30 +128,31 @@ class AlignMultipleDatasets:
 
                 existing_common_dataset_ids.add(metadata_id)
 
-            self.progress.advance(self.task_id)
+            batched_progress.advance()
             yield list(non_aligned.values())
 
-    def get_common_aligned_ids(
-        self, all_common_dataset_mapping: list[CommonDatasetMapping]
-    ) -> set[str]:
+        batched_progress.flush()
+
+    def get_common_aligned_ids(self, all_common_ids: list[KeysView[str]]) -> set[str]:
         """Get IDs of instances from the common dataset which are aligned across all datasets.
 
         The IDs returned are for the `self.common_dataset`.
         """
-        return set.intersection(*[set(mapping.keys()) for mapping in all_common_dataset_mapping])
+        first_common_ids, *other_common_ids = all_common_ids
+        return set(first_common_ids).intersection(*other_common_ids)
 
     def get_non_aligned_common_ids(
-        self, all_common_dataset_mapping: list[CommonDatasetMapping], aligned_common_ids: set[str]
+        self, all_common_ids: list[KeysView[str]], aligned_common_ids: set[str]
     ) -> set[str]:
         """Get instance IDs which are aligned to the common dataset but not across all datasets.
 
         In other words, this returns a set of IDs from the common dataset which ARE aligned to one
         other dataset, but NOT ALL of the other datasets.
         """
-        all_non_overlapping_ids = [
-            set(mapping.keys()) - aligned_common_ids for mapping in all_common_dataset_mapping
-        ]
-        return set.union(*all_non_overlapping_ids)
+        non_aligned_ids: set[str] = set()
+        for common_ids in all_common_ids:
+            non_aligned_ids |= common_ids - aligned_common_ids
+        return non_aligned_ids
 
     def _get_mapping_to_common_dataset(
         self, aligned_metadata: DatasetAlignerReturn
@@ -142,34 +164,27 @@ class AlignMultipleDatasets:
 
     def _calculate_total(
         self,
-        all_common_dataset_mapping: list[CommonDatasetMapping],
+        aligned_common_ids: set[str],
+        common_ids_aligned_to_other_dataset: set[str],
         aligned_metadata_iterable: Iterable[DatasetAlignerReturn],
     ) -> int:
         """Calculate total number of instances that will be returned."""
-        aligned_common_ids = self.get_common_aligned_ids(all_common_dataset_mapping)
+        common_ids_not_aligned_to_any_dataset: set[str] = set()
+        num_not_aligned_to_common_dataset = 0
 
-        common_ids_aligned_to_other_dataset = self.get_non_aligned_common_ids(
-            all_common_dataset_mapping, aligned_common_ids
-        )
-
-        common_ids_not_aligned_to_any_dataset = {
-            metadata_dict[self.common_dataset].id
-            for metadata_list in aligned_metadata_iterable
-            for metadata_dict in metadata_list.non_aligned
-            if self.common_dataset in metadata_dict
-            and metadata_dict[self.common_dataset].id not in common_ids_aligned_to_other_dataset
-        }
+        for metadata_list in aligned_metadata_iterable:
+            for metadata_dict in metadata_list.non_aligned:
+                if self.common_dataset not in metadata_dict:
+                    num_not_aligned_to_common_dataset += 1
+                    continue
 
-        other_instances_not_aligned_to_common_dataset = [
-            metadata_dict
-            for metadata_list in aligned_metadata_iterable
-            for metadata_dict in metadata_list.non_aligned
-            if self.common_dataset not in metadata_dict
-        ]
+                common_id = metadata_dict[self.common_dataset].id
+                if common_id not in common_ids_aligned_to_other_dataset:
+                    common_ids_not_aligned_to_any_dataset.add(common_id)
 
         return (
             len(aligned_common_ids)
             + len(common_ids_aligned_to_other_dataset)
             + len(common_ids_not_aligned_to_any_dataset)
-            + len(other_instances_not_aligned_to_common_dataset)
+            + num_not_aligned_to_common_dataset
         )
@@ -1,4 +1,5 @@
 from collections.abc import Iterator
+from pathlib import Path
 from typing import Any
 
 from overrides import overrides
@@ -29,20 +30,24 @@ class AlfredCaptionExtractor(AnnotationExtractor[Caption]):
     @overrides(check_signature=False)
     def convert(self, raw_feature: AlfredMetadata) -> list[tuple[int, list[Caption]]]:
         """Convert raw feature to caption."""
-        num_subgoals = min(len(ann.high_descs) for ann in raw_feature.turk_annotations["anns"])
-
-        captions = []
-        for high_idx in range(num_subgoals):
-            subgoal_captions = []
-            for ann in raw_feature.turk_annotations["anns"]:
-                subgoal_captions.append(Caption(text=self._prep_caption(ann.high_descs[high_idx])))
-            captions.append((high_idx, subgoal_captions))
-
-        return captions
-
-    def process_single_instance(self, raw_instance: dict[str, Any]) -> None:
-        """Process raw instance and write to file."""
-        structured_instance = AlfredMetadata.parse_obj(raw_instance)
+        all_high_descs = [ann.high_descs for ann in raw_feature.turk_annotations["anns"]]
+        num_subgoals = min(len(high_descs) for high_descs in all_high_descs)
+
+        # The descriptions have already been validated, so skip the pydantic validation
+        return [
+            (
+                high_idx,
+                [
+                    Caption.construct(text=self._prep_caption(high_descs[high_idx]))
+                    for high_descs in all_high_descs
+                ],
+            )
+            for high_idx in range(num_subgoals)
+        ]
+
+    def process_single_instance(self, raw_instance: Path) -> None:
+        """Read the raw instance from its file, process it and write to file."""
+        structured_instance = AlfredMetadata.parse_obj(self.read(raw_instance))
         self._process_subgoal_instances(structured_instance)
         self._process_trajectory_instance(structured_instance)
 
@@ -74,18 +79,15 @@ class AlfredCaptionExtractor(AnnotationExtractor[Caption]):
 
         for ann in raw_feature.turk_annotations["anns"]:
             ann_captions = [self._prep_caption(caption) for caption in ann.high_descs]
-            captions.append(Caption(text=" ".join(ann_captions)))
+            captions.append(Caption.construct(text=" ".join(ann_captions)))
 
         return captions
 
     def _read(self) -> Iterator[Any]:
-        """Reads all the trajectory metadata from the train and valid_seen data paths.
+        """Get the paths to all the trajectory metadata files from the train and valid_seen splits.
 
-        For ALFRED we have to override this to make sure that all the single trajectory files are
-        correctly combined in a single list.
+        For ALFRED, each trajectory is in its own file. Each file is read within
+        `process_single_instance()` so that, when a pool is used, the files are read in parallel
+        and only the paths need to be sent to each worker.
         """
-        raw_data = (
-            self.process_raw_file_return(self.read(file_path)) for file_path in self.file_paths
-        )
-
-        return self.postprocess_raw_data(raw_data)
+        return iter(self.file_paths)
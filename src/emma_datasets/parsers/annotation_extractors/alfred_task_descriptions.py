@@ -1,4 +1,5 @@
 from collections.abc import Iterator
+from pathlib import Path
 from typing import Any
 
 from overrides import overrides
@@ -35,21 +36,18 @@ class AlfredTaskDescriptionExtractor(AnnotationExtractor[TaskDescription]):
 
         return task_descriptions
 
-    def process_single_instance(self, raw_instance: dict[str, Any]) -> None:
-        """Process raw instance and write to file."""
-        structured_instance = AlfredMetadata.parse_obj(raw_instance)
+    def process_single_instance(self, raw_instance: Path) -> None:
+        """Read the raw instance from its file, process it and write to file."""
+        structured_instance = AlfredMetadata.parse_obj(self.read(raw_instance))
         task_descriptions = self.convert(structured_instance)
         file_id = f"{structured_instance.task_id}"
         self._write(task_descriptions, file_id)
 
     def _read(self) -> Iterator[Any]:
-        """Reads all the trajectory metadata from the train and valid_seen data paths.
+        """Get the paths to all the trajectory metadata files from the train and valid_seen splits.
 
-        For ALFRED we have to override this to make sure that all the single trajectory files are
-        correctly combined in a single list.
+        For ALFRED, each trajectory is in its own file. Each file is read within
+        `process_single_instance()` so that, when a pool is used, the files are read in parallel
+        and only the paths need to be sent to each worker.
         """
-        raw_data = (
-            self.process_raw_file_return(self.read(file_path)) for file_path in self.file_paths
-        )
-
-        return self.postprocess_raw_data(raw_data)
+        return iter(self.file_paths)
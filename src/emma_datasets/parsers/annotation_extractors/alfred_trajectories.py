@@ -1,11 +1,11 @@
-import itertools
 from collections.abc import Iterator
+from pathlib import Path
 from typing import Any
 
 from overrides import overrides
 
 from emma_datasets.datamodels import ActionTrajectory, AnnotationType, DatasetName
-from emma_datasets.datamodels.datasets import AlfredMetadata
+from emma_datasets.datamodels.datasets import AlfredHighAction, AlfredLowAction, AlfredMetadata
 from emma_datasets.io import read_json
 from emma_datasets.parsers.annotation_extractors.annotation_extractor import AnnotationExtractor
 
@@ -36,15 +36,23 @@ class AlfredTrajectoryExtractor(AnnotationExtractor[ActionTrajectory]):
         that one language instruction can cover multiple subgoals, which can cause errors in how
         we've parsed and structured them.
         """
-        trajectories: list[tuple[int, ActionTrajectory]] = []
-
-        all_subgoals = itertools.groupby(raw_feature.plan.low_level_actions, lambda x: x.high_idx)
-        for high_idx, subgoal in all_subgoals:
-            trajectory = ActionTrajectory(
-                low_level_actions=list(subgoal),
-                high_level_actions=[raw_feature.plan.high_level_actions[high_idx]],
+        high_level_actions = raw_feature.plan.high_level_actions
+
+        # The low-level actions are grouped by their subgoal, which indexes the high-level actions
+        all_subgoals: list[list[AlfredLowAction]] = [[] for _ in high_level_actions]
+        for low_level_action in raw_feature.plan.low_level_actions:
+            all_subgoals[low_level_action.high_idx].append(low_level_action)
+
+        trajectories: list[tuple[int, ActionTrajectory]] = [
+            (
+                high_idx,
+                ActionTrajectory(
+                    low_level_actions=subgoal, high_level_actions=[high_level_actions[high_idx]]
+                ),
             )
-            trajectories.append((high_idx, trajectory))
+            for high_idx, subgoal in enumerate(all_subgoals)
+            if subgoal
+        ]
 
         num_language_instructions = min(
             len(ann.high_descs) for ann in raw_feature.turk_annotations["anns"]
@@ -73,9 +81,9 @@ class AlfredTrajectoryExtractor(AnnotationExtractor[ActionTrajectory]):
 
         return trajectories
 
-    def process_single_instance(self, raw_instance: dict[str, Any]) -> None:
-        """Process raw instance and write to file."""
-        structured_instance = AlfredMetadata.parse_obj(raw_instance)
+    def process_single_instance(self, raw_instance: Path) -> None:
+        """Read the raw instance from its file, process it and write to file."""
+        structured_instance = AlfredMetadata.parse_obj(self.read(raw_instance))
         trajectories = self.convert(structured_instance)
         self._process_subgoal_instances(
             task_id=structured_instance.task_id, trajectories=trajectories
@@ -106,30 +114,26 @@ class AlfredTrajectoryExtractor(AnnotationExtractor[ActionTrajectory]):
     def _merge_trajectories(
         self, trajectories: list[tuple[int, ActionTrajectory]]
     ) -> ActionTrajectory:
-        """Merge trajectories for a full task."""
-        high_indices = len(trajectories)
-        traj_dict = dict(trajectories)
-        low_level_actions = itertools.chain(
-            *[traj_dict[high_idx].low_level_actions for high_idx in range(high_indices)]
-        )
+        """Merge trajectories for a full task.
 
-        high_level_actions = itertools.chain(
-            *[traj_dict[high_idx].high_level_actions for high_idx in range(high_indices)]
-        )
+        The trajectories are already ordered by their subgoal index from `convert()`.
+        """
+        low_level_actions: list[AlfredLowAction] = []
+        high_level_actions: list[AlfredHighAction] = []
+
+        for _, trajectory in trajectories:
+            low_level_actions.extend(trajectory.low_level_actions)
+            high_level_actions.extend(trajectory.high_level_actions)
 
         return ActionTrajectory(
-            low_level_actions=list(low_level_actions),
-            high_level_actions=list(high_level_actions),
+            low_level_actions=low_level_actions, high_level_actions=high_level_actions
         )
 
     def _read(self) -> Iterator[Any]:
-        """Reads all the trajectory metadata from the train and valid_seen data paths.
+        """Get the paths to all the trajectory metadata files from the train and valid_seen splits.
 
-        For ALFRED we have to override this to make sure that all the single trajectory files are
-        correctly combined in a single list.
+        For ALFRED, each trajectory is in its own file. Each file is read within
+        `process_single_instance()` so that, when a pool is used, the files are read in parallel
+        and only the paths need to be sent to each worker.
         """
-        raw_data = (
-            self.process_raw_file_return(self.read(file_path)) for file_path in self.file_paths
-        )
-
-        return self.postprocess_raw_data(raw_data)
+        return iter(self.file_paths)
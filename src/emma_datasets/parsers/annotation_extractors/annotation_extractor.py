@@ -1,6 +1,8 @@
 import itertools
 from abc import ABC, abstractmethod
+from collections import deque
 from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from multiprocessing.pool import Pool
 from pathlib import Path
 from typing import Any, Generic, Optional, TypeVar, Union, overload
@@ -15,6 +17,8 @@ from emma_datasets.io import get_all_file_paths, read_json, write_json
 Annotation = TypeVar("Annotation", bound=BaseModel)
 AnnotationPaths = Union[str, list[str], Path, list[Path], list[tuple[Path, Path]]]  # noqa: WPS221
 
+DEFAULT_POOL_CHUNKSIZE = 64
+
 
 class AnnotationExtractor(ABC, Generic[Annotation]):
     """Extract annotations from the raw dataset into multiple files for easier loading.
@@ -73,6 +77,11 @@ class AnnotationExtractor(ABC, Generic[Annotation]):
         """The file extension of the raw data files."""
         return "json"
 
+    @property
+    def pool_chunksize(self) -> int:
+        """The number of raw instances sent to a pool worker at a time."""
+        return DEFAULT_POOL_CHUNKSIZE
+
     @overload
     def run(self, progress: Progress, pool: Pool) -> None:
         ...  # noqa: WPS428
@@ -98,7 +107,10 @@ class AnnotationExtractor(ABC, Generic[Annotation]):
 
         progress.update(self.task_id, comment="Processing data")
         if pool is not None:
-            for _ in pool.imap_unordered(self.process_single_instance, raw_data):
+            processed_instances = pool.imap_unordered(
+                self.process_single_instance, raw_data, chunksize=self.pool_chunksize
+            )
+            for _ in processed_instances:
                 self._advance(progress)
         else:
             for raw_input in raw_data:
@@ -155,13 +167,31 @@ class AnnotationExtractor(ABC, Generic[Annotation]):
 
     def _read(self) -> Iterator[Any]:
         """Read all files and return a single Iterator over all of them."""
-        raw_data = itertools.chain.from_iterable(
-            self.process_raw_file_return(self.read(file_path))  # type: ignore[arg-type]
-            for file_path in self.file_paths
-        )
+        raw_data = itertools.chain.from_iterable(self._prefetch_reads())
 
         return self.postprocess_raw_data(raw_data)
 
+    def _prefetch_reads(self, num_prefetch: int = 8) -> Iterator[Any]:
+        """Read each file in order, while reading the next few files in background threads."""
+        file_paths = iter(self.file_paths)
+
+        with ThreadPoolExecutor(max_workers=num_prefetch) as executor:
+            pending_reads = deque(
+                executor.submit(self.read, file_path)  # type: ignore[arg-type]
+                for file_path in itertools.islice(file_paths, num_prefetch)
+            )
+
+            while pending_reads:
+                raw_file = pending_reads.popleft().result()
+
+                next_file_path = next(file_paths, None)
+                if next_file_path is not None:
+                    pending_reads.append(
+                        executor.submit(self.read, next_file_path)  # type: ignore[arg-type]
+                    )
+
+                yield self.process_raw_file_return(raw_file)
+
     def _write(
         self,
         features: Union[Annotation, Iterable[Annotation]],
@@ -1,9 +1,7 @@
-import itertools
+from collections import defaultdict
 from collections.abc import Iterator
 from typing import Any
 
-from pydantic import parse_obj_as
-
 from emma_datasets.datamodels import AnnotationType, Caption, DatasetName
 from emma_datasets.datamodels.datasets import CocoCaption
 from emma_datasets.parsers.annotation_extractors.annotation_extractor import AnnotationExtractor
@@ -28,14 +26,11 @@ class CocoCaptionExtractor(AnnotationExtractor[Caption]):
 
     def postprocess_raw_data(self, raw_data: Any) -> Any:
         """Group the captions by image ID."""
-        sorted_raw_data = sorted(raw_data, key=lambda k: k["image_id"])
-        grouped_captions_generator = itertools.groupby(
-            sorted_raw_data, key=lambda k: k["image_id"]
-        )
-        return (
-            (image_id, list(grouped_captions))
-            for image_id, grouped_captions in grouped_captions_generator
-        )
+        grouped_captions: defaultdict[int, list[dict[str, Any]]] = defaultdict(list)
+        for caption in raw_data:
+            grouped_captions[caption["image_id"]].append(caption)
+
+        return iter(grouped_captions.items())
 
     def convert(self, raw_feature: list[CocoCaption]) -> Iterator[Caption]:
         """Convert objects to the common Caption."""
@@ -44,6 +39,6 @@ class CocoCaptionExtractor(AnnotationExtractor[Caption]):
     def process_single_instance(self, raw_instance: Any) -> None:
         """Process raw instance and write to file."""
         image_id, grouped_captions = raw_instance
-        structured_raw = parse_obj_as(list[CocoCaption], grouped_captions)
+        structured_raw = [CocoCaption.parse_obj(caption) for caption in grouped_captions]
         features = self.convert(structured_raw)
         self._write(features, image_id)
@@ -1,8 +1,8 @@
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
 from overrides import overrides
-from pydantic import parse_obj_as
 
 from emma_datasets.datamodels import AnnotationType, Caption, DatasetName
 from emma_datasets.io import get_all_file_paths, read_parquet
@@ -33,6 +33,11 @@ class ConceptualCaptionsExtractor(AnnotationExtractor[Caption]):
         """The file extension of the raw data files."""
         return "parquet"
 
+    @property
+    def pool_chunksize(self) -> int:
+        """Send one shard to a pool worker at a time, since each shard is already large."""
+        return 1
+
     def read(self, file_path: Path) -> Any:
         """Read the json file.
 
@@ -41,7 +46,7 @@ class ConceptualCaptionsExtractor(AnnotationExtractor[Caption]):
         is 00159 and the split is train. These are then used to store the data in the output_dir
         keeping the sharding to avoid overflowing the file system.
         """
-        data = read_parquet(file_path)
+        data = read_parquet(file_path, columns=["key", "caption"])
         shard_id = file_path.stem
         split = file_path.parents[0].name
 
@@ -51,29 +56,31 @@ class ConceptualCaptionsExtractor(AnnotationExtractor[Caption]):
 
     def convert(self, raw_instance: Any) -> list[Caption]:
         """Convert objects to the common Caption."""
-        caption = raw_instance["caption"]
-        caption_instance = parse_obj_as(list[Caption], [{"text": caption}])
-
-        return caption_instance
+        # The captions are read straight from the parquet file, so skip the pydantic validation
+        return [Caption.construct(text=raw_instance)]
 
     def process_single_instance(self, raw_instances: Any) -> None:
         """Process raw instance and write to file."""
-        shard_out_dir = self.output_dir.joinpath(raw_instances.split[0], raw_instances.shard_id[0])
+        split = raw_instances.split[0]
+        shard_id = raw_instances.shard_id[0]
+
+        shard_out_dir = self.output_dir.joinpath(split, shard_id)
         shard_out_dir.mkdir(parents=True, exist_ok=True)
-        for _, raw_instance in raw_instances.iterrows():
-            caption_instance = self.convert(raw_instance)
 
-            shard_out_file_path = Path(
-                raw_instances.split[0], raw_instances.shard_id[0], raw_instance.key
-            )
-            self._write(caption_instance, str(shard_out_file_path))
+        keys = raw_instances["key"].tolist()
+        captions = raw_instances["caption"].tolist()
+
+        for key, caption in zip(keys, captions):
+            caption_instance = self.convert(caption)
+            self._write(caption_instance, str(Path(split, shard_id, key)))
 
     @overrides(check_signature=False)
-    def _read(self) -> list[dict[str, Any]]:
-        """Read all files and return a single Iterator over all of them."""
-        return [
-            self.process_raw_file_return(self.read(file_path)) for file_path in self.file_paths  # type: ignore[arg-type]
-        ]
+    def _read(self) -> Iterator[Any]:
+        """Read each shard, only holding the few shards that are being prefetched in memory.
+
+        Each shard is returned as a whole so that it can be processed by a single worker.
+        """
+        return self._prefetch_reads()
 
     def _get_all_file_paths(self) -> None:
         """Get all the file paths for the dataset and store in state."""
@@ -1,7 +1,6 @@
 from typing import Any
 
 from emma_datasets.datamodels import AnnotationType, Caption, DatasetName
-from emma_datasets.datamodels.datasets import EpicKitchensNarrationMetadata
 from emma_datasets.io import read_csv
 from emma_datasets.parsers.annotation_extractors.annotation_extractor import AnnotationExtractor
 
@@ -28,12 +27,12 @@ class EpicKitchensCaptionExtractor(AnnotationExtractor[Caption]):
         """Read Epic Kitchen CSV file."""
         return read_csv(file_path)
 
-    def convert(self, raw_feature: EpicKitchensNarrationMetadata) -> list[Caption]:
+    def convert(self, raw_feature: dict[str, Any]) -> list[Caption]:
         """Convert raw feature to caption."""
-        return [Caption(text=raw_feature.narration)]
+        # Only the narration is needed, so skip validating every column of the row
+        return [Caption.construct(text=raw_feature["narration"])]
 
     def process_single_instance(self, raw_instance: dict[str, Any]) -> None:
         """Process raw instance and write to file."""
-        structured_instance = EpicKitchensNarrationMetadata.parse_obj(raw_instance)
-        caption = self.convert(structured_instance)
-        self._write(caption, structured_instance.narration_id)
+        caption = self.convert(raw_instance)
+        self._write(caption, raw_instance["narration_id"])
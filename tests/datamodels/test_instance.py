@@ -0,0 +1,84 @@
+from pathlib import Path
+
+from emma_datasets.datamodels import (
+    ActionTrajectory,
+    Caption,
+    DatasetMetadata,
+    DatasetName,
+    MediaType,
+    SourceMedia,
+)
+from emma_datasets.datamodels.datasets.alfred import AlfredLowAction
+from emma_datasets.datamodels.instance import Instance
+
+
+def _dataset_metadata(dataset_name: DatasetName) -> DatasetMetadata:
+    return DatasetMetadata(
+        id="1",
+        name=dataset_name,
+        media=SourceMedia(media_type=MediaType.image),
+        features_path=Path("1.pt"),
+    )
+
+
+def test_modality_follows_changes_to_the_dataset() -> None:
+    instance = Instance(dataset={DatasetName.coco: _dataset_metadata(DatasetName.coco)})
+    assert instance.modality == MediaType.image
+
+    instance.dataset = {DatasetName.epic_kitchens: _dataset_metadata(DatasetName.epic_kitchens)}
+    assert instance.modality == MediaType.video
+
+
+def test_modality_follows_updates_when_copying_instance() -> None:
+    instance = Instance(dataset={DatasetName.coco: _dataset_metadata(DatasetName.coco)})
+    assert instance.modality == MediaType.image
+
+    instance_copy = instance.copy(
+        update={
+            "dataset": {DatasetName.epic_kitchens: _dataset_metadata(DatasetName.epic_kitchens)}
+        }
+    )
+    assert instance_copy.modality == MediaType.video
+    assert instance.modality == MediaType.image
+
+
+def test_language_annotations_follow_changes_to_captions() -> None:
+    instance = Instance(
+        dataset={DatasetName.coco: _dataset_metadata(DatasetName.coco)},
+        captions=[Caption(text="a cat")],
+    )
+    assert instance.language_annotations == ["a cat"]
+
+    instance.captions = [Caption(text="a dog")]
+    assert instance.language_annotations == ["a dog"]
+
+    instance_copy = instance.copy(update={"captions": [Caption(text="a bird")]})
+    assert instance_copy.language_annotations == ["a bird"]
+    assert instance.language_annotations == ["a dog"]
+
+
+def test_language_annotations_are_only_built_once() -> None:
+    instance = Instance(
+        dataset={DatasetName.coco: _dataset_metadata(DatasetName.coco)},
+        captions=[Caption(text="a cat")],
+    )
+
+    assert instance.language_annotations is instance.language_annotations
+
+
+def test_trajectory_is_a_single_language_annotation() -> None:
+    low_level_action = AlfredLowAction.parse_obj(
+        {
+            "api_action": {"action": "MoveAhead"},
+            "discrete_action": {"action": "MoveAhead_25", "args": {}},
+            "high_idx": 0,
+        }
+    )
+    instance = Instance(
+        dataset={DatasetName.alfred: _dataset_metadata(DatasetName.alfred)},
+        trajectory=ActionTrajectory(
+            low_level_actions=[low_level_action, low_level_action], high_level_actions=[]
+        ),
+    )
+
+    assert instance.language_annotations == ["Move Ahead 25 Move Ahead 25"]
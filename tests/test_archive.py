@@ -0,0 +1,95 @@
+import io
+import tarfile
+import zipfile
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+from emma_datasets.common import get_progress
+from emma_datasets.io import archive, extract_archive
+
+
+def _get_archive_files() -> dict[str, bytes]:
+    archive_files = {}
+    for idx in range(10):
+        file_name = f"root/dir{idx % 3}/file{idx}.txt"
+        archive_files[file_name] = f"file {idx}".encode()
+    return archive_files
+
+
+def _create_tar_archive(archive_path: Path) -> Path:
+    with tarfile.open(archive_path, "w:gz") as tar_file:
+        for file_name, file_contents in _get_archive_files().items():
+            tar_info = tarfile.TarInfo(file_name)
+            tar_info.size = len(file_contents)
+            tar_file.addfile(tar_info, io.BytesIO(file_contents))
+    return archive_path
+
+
+def _create_zip_archive(archive_path: Path, num_files: int) -> Path:
+    with zipfile.ZipFile(archive_path, "w") as zip_file:
+        for idx in range(num_files):
+            zip_file.writestr(f"root/dir{idx % 3}/file{idx}.txt", f"file {idx}")
+    return archive_path
+
+
+def _extract_and_verify(archive_path: Path, output_dir: Path) -> None:
+    progress = get_progress()
+    task_id = progress.add_task("Extracting", total=0, start=False, visible=False, comment="")
+
+    extract_archive(archive_path, task_id, progress, output_dir=output_dir)
+
+    archive_files = _get_archive_files()
+    for file_name, file_contents in archive_files.items():
+        assert output_dir.joinpath(file_name).read_bytes() == file_contents
+    assert progress.tasks[task_id].completed == len(archive_files)
+
+
+@pytest.mark.parametrize("archive_name", ["archive.tar.gz", "archive.tgz"])
+def test_extract_gzip_tar_without_rapidgzip(
+    archive_name: str, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(archive, "rapidgzip", None)
+
+    archive_path = _create_tar_archive(tmp_path.joinpath(archive_name))
+
+    _extract_and_verify(archive_path, tmp_path.joinpath("output"))
+
+
+@pytest.mark.parametrize("archive_name", ["archive.tar.gz", "archive.tgz"])
+def test_extract_gzip_tar_with_rapidgzip(
+    archive_name: str, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    rapidgzip = pytest.importorskip("rapidgzip")
+    rapidgzip_open = Mock(wraps=rapidgzip.open)
+    monkeypatch.setattr(archive, "rapidgzip", rapidgzip)
+    monkeypatch.setattr(rapidgzip, "open", rapidgzip_open)
+
+    archive_path = _create_tar_archive(tmp_path.joinpath(archive_name))
+
+    _extract_and_verify(archive_path, tmp_path.joinpath("output"))
+    rapidgzip_open.assert_called_once()
+    assert rapidgzip_open.call_args.args[0] == str(archive_path)
+
+
+def test_extract_zip_only_uses_as_many_workers_as_needed(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    num_files = archive.MIN_FILES_PER_EXTRACTION_WORKER + 1
+    archive_path = _create_zip_archive(tmp_path.joinpath("archive.zip"), num_files)
+    output_dir = tmp_path.joinpath("output")
+
+    extractor = archive.ExtractArchive()
+    extract_zip_members = Mock(wraps=extractor._extract_zip_members)  # noqa: WPS437
+    monkeypatch.setattr(archive.os, "cpu_count", lambda: 8)
+    monkeypatch.setattr(extractor, "_extract_zip_members", extract_zip_members)
+
+    progress = get_progress()
+    task_id = progress.add_task("Extracting", total=0, start=False, visible=False, comment="")
+    extractor(archive_path, task_id, progress, output_dir=output_dir)
+
+    assert extract_zip_members.call_count == 2
+    for idx in range(num_files):
+        extracted_file = output_dir.joinpath(f"root/dir{idx % 3}/file{idx}.txt")
+        assert extracted_file.read_text() == f"file {idx}"
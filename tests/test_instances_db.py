@@ -1,3 +1,4 @@
+from multiprocessing.pool import Pool
 from pathlib import Path
 
 import pytest
@@ -89,3 +90,46 @@ def test_access_to_instance_attributes_without_error(subset_instances_db: Datase
         assert new_instance.modality
         assert new_instance.features_path
         assert new_instance.source_paths
+
+
+def test_can_read_multiple_instances_from_db(instances_db: DatasetDb) -> None:
+    keys = [2, 0, 2]
+    assert instances_db.__getitems__(keys) == [instances_db[key] for key in keys]
+
+    with pytest.raises(KeyError):
+        instances_db.__getitems__([0, len(instances_db) + 1])
+
+
+def test_extend_writes_all_instances(instances_db: DatasetDb, tmp_path: Path) -> None:
+    db_items = [
+        ((data_id, example_id), instance) for data_id, example_id, instance in instances_db
+    ]
+
+    with DatasetDb(tmp_path.joinpath("extended.db"), readonly=False, batch_size=64) as write_db:
+        write_db.extend(db_items)
+        assert len(write_db) == len(db_items)
+
+    extended_db = DatasetDb(tmp_path.joinpath("extended.db"))
+    assert list(extended_db) == [
+        (data_id, example_id, instance) for (data_id, example_id), instance in db_items
+    ]
+
+
+def test_extend_with_pool_writes_all_instances(instances_db: DatasetDb, tmp_path: Path) -> None:
+    db_items = [
+        ((data_id, example_id), instance) for data_id, example_id, instance in instances_db
+    ]
+    batch_size = 64
+    # Make sure that the items are written over several batches, the last of which is not full
+    assert len(db_items) > batch_size
+    assert len(db_items) % batch_size
+
+    write_db = DatasetDb(tmp_path.joinpath("extended.db"), readonly=False, batch_size=batch_size)
+    with write_db, Pool(2) as pool:  # noqa: WPS316
+        write_db.extend(db_items, pool=pool)
+        assert len(write_db) == len(db_items)
+
+    extended_db = DatasetDb(tmp_path.joinpath("extended.db"))
+    assert list(extended_db) == [
+        (data_id, example_id, instance) for (data_id, example_id), instance in db_items
+    ]
@@ -0,0 +1,15 @@
+from emma_datasets.common import BatchedProgress, get_progress
+
+
+def test_batched_progress_shows_the_last_comment_when_flushed() -> None:
+    progress = get_progress()
+    task_id = progress.add_task("Extracting", total=5, visible=False, comment="")
+    batched_progress = BatchedProgress(progress, task_id, batch_size=2, flush_interval=60)
+
+    for idx in range(5):
+        batched_progress.advance(comment=f"Extracting file{idx}.txt")
+    batched_progress.flush()
+
+    task = progress.tasks[0]
+    assert task.completed == 5
+    assert task.fields["comment"] == "Extracting file4.txt"